@@ -1,4 +1,5 @@
 import click
+import functools
 import os
 from rich.console import Console
 from rich.table import Table
@@ -8,6 +9,16 @@ from ..core.repository import Repository
 
 console = Console()
 
+@functools.lru_cache(maxsize=16)
+def _get_repo(path: str, is_remote: bool) -> Repository:
+    """Construct (or reuse) a Repository for the given path.
+
+    Opening a Repository re-scans .git (and may hit the network for
+    remotes), so cache instances per (path, is_remote) for embedded or
+    repeated invocations.
+    """
+    return Repository(path, is_remote=is_remote)
+
 @click.group()
 def cli():
     """GitPulse - Git Repository Analytics Tool"""
@@ -16,7 +27,7 @@ def cli():
 @cli.command()
 @click.argument('path')
 @click.option('--remote', is_flag=True, help='Analyze a remote GitHub repository')
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token(s), comma-separated to round-robin')
 def analyze(path: str, remote: bool, token: str):
     """Analyze a Git repository and display contribution statistics."""
     try:
@@ -29,7 +40,7 @@ def analyze(path: str, remote: bool, token: str):
             if not os.path.exists(path):
                 raise click.BadParameter(f"Path '{path}' does not exist")
         
-        repo = Repository(path, is_remote=remote)
+        repo = _get_repo(path if remote else os.path.abspath(path), remote)
         
         # Perform complete analysis
         repo.analyze()
@@ -41,7 +52,7 @@ def analyze(path: str, remote: bool, token: str):
 @cli.command()
 @click.argument('path')
 @click.option('--remote', is_flag=True, help='Analyze a remote GitHub repository')
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token(s), comma-separated to round-robin')
 def codebase(path: str, remote: bool, token: str):
     """Analyze the codebase/repository structure."""
     try:
@@ -54,7 +65,7 @@ def codebase(path: str, remote: bool, token: str):
             if not os.path.exists(path):
                 raise click.BadParameter(f"Path '{path}' does not exist")
         
-        repo = Repository(path, is_remote=remote)
+        repo = _get_repo(path if remote else os.path.abspath(path), remote)
         
         # Analyze only the codebase
         repo.analyze_codebase()
@@ -66,7 +77,7 @@ def codebase(path: str, remote: bool, token: str):
 @cli.command()
 @click.argument('path')
 @click.option('--remote', is_flag=True, help='Analyze a remote GitHub repository')
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token(s), comma-separated to round-robin')
 def contributors(path: str, remote: bool, token: str):
     """Analyze contributors to the repository."""
     try:
@@ -79,7 +90,7 @@ def contributors(path: str, remote: bool, token: str):
             if not os.path.exists(path):
                 raise click.BadParameter(f"Path '{path}' does not exist")
         
-        repo = Repository(path, is_remote=remote)
+        repo = _get_repo(path if remote else os.path.abspath(path), remote)
         
         # Analyze only the contributors
         repo.analyze_contributors()
@@ -91,7 +102,7 @@ def contributors(path: str, remote: bool, token: str):
 @cli.command()
 @click.argument('path', type=click.Path(exists=True))
 @click.option('--remote', is_flag=True, help='Analyze a remote GitHub repository')
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token(s), comma-separated to round-robin')
 @click.option('--lines', is_flag=True, help='Show lines of code statistics instead of file counts')
 def languages(path: str, remote: bool, token: str, lines: bool):
     """Show language distribution in the repository."""
@@ -100,7 +111,7 @@ def languages(path: str, remote: bool, token: str, lines: bool):
         if token:
             os.environ['GITHUB_TOKEN'] = token
             
-        repo = Repository(path, is_remote=remote)
+        repo = _get_repo(path if remote else os.path.abspath(path), remote)
         
         if remote:
             # For remote repos, use GitHub API
@@ -167,7 +178,7 @@ def languages(path: str, remote: bool, token: str, lines: bool):
 @cli.command()
 @click.argument('path', type=click.Path(exists=True))
 @click.option('--remote', is_flag=True, help='Analyze a remote GitHub repository')
-@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token')
+@click.option('--token', envvar='GITHUB_TOKEN', help='GitHub personal access token(s), comma-separated to round-robin')
 def loc(path: str, remote: bool, token: str):
     """Show detailed lines of code statistics for the repository."""
     try:
@@ -175,7 +186,7 @@ def loc(path: str, remote: bool, token: str):
         if token:
             os.environ['GITHUB_TOKEN'] = token
             
-        repo = Repository(path, is_remote=remote)
+        repo = _get_repo(path if remote else os.path.abspath(path), remote)
         
         if remote:
             # For remote repos, LOC stats not available
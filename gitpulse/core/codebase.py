@@ -1,11 +1,121 @@
+import json
+import mmap
+import os
+import re
+import subprocess
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import git
 from git import Repo
-from rich.console import Console
-from rich.table import Table
+
+from ..utils.exclusions import FileExclusions
+
+# Shared Rich console, created lazily: importing rich costs tens of ms on
+# a cold interpreter, which quick CLI commands shouldn't pay up front
+_CONSOLE = None
+
+
+def _console():
+    """Get the shared Rich console, importing rich on first use."""
+    global _CONSOLE
+    if _CONSOLE is None:
+        from rich.console import Console
+
+        _CONSOLE = Console()
+    return _CONSOLE
+
+# Map file extensions to programming languages. Hoisted to module level so
+# the hot per-file loops resolve extensions with a single dict lookup
+# instead of rebuilding the mapping on every call.
+_EXT_TO_LANG = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".java": "Java",
+    ".cpp": "C++",
+    ".c": "C",
+    ".h": "C/C++",
+    ".cs": "C#",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".swift": "Swift",
+    ".kt": "Kotlin",
+    ".scala": "Scala",
+    ".r": "R",
+    ".m": "MATLAB",
+    ".sh": "Shell",
+    ".bash": "Shell",
+    ".bat": "Batch",
+    ".ps1": "PowerShell",
+    ".ipynb": "Jupyter Notebook",
+    ".cmd": "Command Prompt",
+    ".sql": "SQL",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".md": "Markdown",
+    ".json": "JSON",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".xml": "XML",
+    ".txt": "Text",
+}
+
+
+# File types that are typically considered "code" for LOC statistics
+_CODE_EXTS = frozenset({
+    ".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".cpp", ".c", ".h",
+    ".cs", ".rb", ".php", ".go", ".rs", ".swift", ".kt", ".scala",
+    ".r", ".m", ".sh", ".bash", ".sql", ".html", ".css", ".scss",
+    ".sass", ".less", ".xml", ".yaml", ".yml", ".json", ".toml",
+})
+
+# Extensions worth opening for a line count. Everything in _EXT_TO_LANG is
+# textual; extension-less files (LICENSE, Makefile, dotfiles) and a few
+# common config/style formats are included as well. Binary blobs (images,
+# archives, compiled artifacts) never make it past this allowlist.
+_TEXT_EXTS = frozenset(_EXT_TO_LANG) | {
+    "",
+    ".toml",
+    ".cfg",
+    ".ini",
+    ".conf",
+    ".rst",
+    ".scss",
+    ".sass",
+    ".less",
+    ".csv",
+    ".tsv",
+    ".svg",
+    ".lock",
+    ".properties",
+}
+
+
+# Matches a trailing extension preceded by at least one non-separator
+# character, mirroring `Path.suffix` semantics (dotfiles like .gitignore
+# have no suffix). Precompiled so classification is one C-level search
+# per path with no intermediate allocations.
+_EXT_RE = re.compile(r"[^/](\.[^./\\]+)$")
+
+
+def _extension_of(file_path: str) -> str:
+    """Extract the lowercased extension from a repo-relative path.
+
+    A single precompiled regex search that matches
+    `Path(file_path).suffix.lower()` without allocating a `Path` object
+    per file.
+    """
+    match = _EXT_RE.search(file_path)
+    return match.group(1).lower() if match else ""
 
 
 class Codebase:
@@ -19,10 +129,15 @@ class Codebase:
         """
         self.path = path
         self.repo = None
-        self.console = Console()
+        self.console = _console()
 
         # Files to exclude from analysis
-        self.excluded_files = ["package-lock.json", "yarn.lock"]
+        self.excluded_files = frozenset(("package-lock.json", "yarn.lock"))
+
+        # Cached, filtered `ls_files` output (invalidated by .git/index mtime)
+        self._files_cache = None
+        self._files_cache_mtime = None
+        self._file_extensions = None
 
         try:
             self.repo = Repo(path)
@@ -41,6 +156,265 @@ class Codebase:
         file_name = Path(file_path).name
         return file_name in self.excluded_files
 
+    def _get_files(self) -> List[str]:
+        """Get the filtered list of tracked files, cached per git index state.
+
+        Running `git ls-files` forks a subprocess and re-parses the full file
+        list, so the result is memoized on the instance. The cache is
+        invalidated by the mtime of `.git/index`, which changes whenever the
+        tracked file set changes.
+
+        Returns:
+            List of tracked file paths with excluded files removed
+        """
+        index_mtime = None
+        try:
+            index_mtime = os.stat(
+                Path(self.path) / ".git" / "index"
+            ).st_mtime_ns
+        except OSError:
+            pass
+
+        if (
+            self._files_cache is not None
+            and index_mtime is not None
+            and index_mtime == self._files_cache_mtime
+        ):
+            return self._files_cache
+
+        excluded = self.excluded_files
+        files = []
+        # Stream `ls-files -z` instead of materializing one giant string;
+        # NUL separators also handle paths containing newlines
+        proc = subprocess.Popen(
+            ["git", "-C", self.path, "ls-files", "-z"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+        )
+        buffer = b""
+        try:
+            for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+                buffer += chunk
+                parts = buffer.split(b"\x00")
+                buffer = parts.pop()
+                for raw in parts:
+                    f = raw.decode("utf-8", errors="replace")
+                    if (
+                        f
+                        and f.rsplit("/", 1)[-1] not in excluded
+                        and not f.endswith((".min.js", ".min.css", ".map"))
+                    ):
+                        files.append(f)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+        # Publish the derived extension map and the file list before the
+        # mtime stamp: the stamp is what validates the cache, so a
+        # concurrent reader passing that check must never observe a
+        # stale or missing _file_extensions
+        self._file_extensions = {f: _extension_of(f) for f in files}
+        self._files_cache = files
+        self._files_cache_mtime = index_mtime
+        return files
+
+    def _iter_log_stream(self, rev_range: Optional[str] = None):
+        """Stream the commit log once and yield per-commit records.
+
+        A single `git log --name-only` subprocess replaces per-commit
+        `iter_commits`/`diff()` round trips through GitPython, which fork a
+        subprocess for every commit on large repositories.
+
+        Args:
+            rev_range: Optional revision range (e.g. "abc123..HEAD") to
+                limit the walk; defaults to the full history
+
+        Yields:
+            Tuples of (commit timestamp, list of changed file paths)
+        """
+        args = [
+            "git",
+            "-C",
+            self.path,
+            "log",
+            "--pretty=tformat:%x01%H%x01%ct",
+            "--name-only",
+            "--no-renames",
+        ]
+        if rev_range:
+            args.append(rev_range)
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+        timestamp = None
+        paths = []
+        try:
+            for line in proc.stdout:
+                line = line.rstrip("\n")
+                if line.startswith("\x01"):
+                    if timestamp is not None:
+                        yield timestamp, paths
+                    timestamp = int(line.rsplit("\x01", 1)[1])
+                    paths = []
+                elif line:
+                    paths.append(line)
+            if timestamp is not None:
+                yield timestamp, paths
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+    def _count_path_changes(self) -> Counter:
+        """Count how many commits touched each path in one log pass.
+
+        Streams `git log --pretty=format: --name-only -z`, which emits
+        only the NUL-separated paths each commit touched — no diff text
+        is ever generated — and feeds them straight into a Counter.
+        Merge commits are skipped so a path isn't double-counted when its
+        branch lands.
+
+        Returns:
+            Counter mapping path to number of commits that changed it
+        """
+        proc = subprocess.Popen(
+            [
+                "git",
+                "-C",
+                self.path,
+                "log",
+                "--pretty=format:",
+                "--name-only",
+                "--no-merges",
+                "--no-renames",
+                "-z",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20,
+        )
+        file_changes = Counter()
+        buffer = b""
+        try:
+            for chunk in iter(lambda: proc.stdout.read(1 << 16), b""):
+                buffer += chunk
+                parts = buffer.split(b"\x00")
+                buffer = parts.pop()
+                for raw in parts:
+                    path = raw.decode("utf-8", errors="replace").lstrip("\n")
+                    if path:
+                        file_changes[path] += 1
+            path = buffer.decode("utf-8", errors="replace").lstrip("\n")
+            if path:
+                file_changes[path] += 1
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        return file_changes
+
+    def _walk_worktree(self) -> List[str]:
+        """Walk the worktree with `os.scandir` and list files on disk.
+
+        The largest-files statistic only cares about files that exist on
+        disk, so a direct scandir walk replaces `git ls-files` plus a
+        per-file `exists()` probe; scandir surfaces the file type without
+        an extra stat() syscall per entry. The `.git` directory and common
+        build/dependency directories are skipped.
+
+        Returns:
+            List of file paths relative to the repository root
+        """
+        paths = []
+        root = self.path
+        excluded = self.excluded_files
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                entries = os.scandir(current)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if (
+                                name == ".git"
+                                or name in FileExclusions.EXCLUDED_DIRS
+                            ):
+                                continue
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if name in excluded or name.endswith(
+                                (".min.js", ".min.css", ".map")
+                            ):
+                                continue
+                            # Size-check here while the dirent is hot
+                            # rather than open()ing oversized files later
+                            if (
+                                entry.stat(follow_symlinks=False).st_size
+                                > 64 * 1024 * 1024
+                            ):
+                                continue
+                            paths.append(os.path.relpath(entry.path, root))
+                    except OSError:
+                        continue
+        return paths
+
+    def _count_lines(self, file_path: str):
+        """Count the lines in a tracked file.
+
+        Memory-maps the file and counts newlines with `bytes.count` over
+        1 MiB slices, which runs as a C scan over contiguous pages rather
+        than a Python-level loop that constructs a str per line. Binary
+        files (NUL byte in the first 8 KiB) and files over 64 MiB are
+        skipped.
+
+        Args:
+            file_path: Path of the file relative to the repository root
+
+        Returns:
+            Tuple of (file_path, line count), or None if the file can't
+            be read or isn't text
+        """
+        # Skip obviously non-text files before paying for an open/read
+        if _extension_of(file_path) not in _TEXT_EXTS:
+            return None
+
+        try:
+            fd = os.open(str(Path(self.path, file_path)), os.O_RDONLY)
+        except OSError:
+            return None
+
+        line_count = 0
+        try:
+            size = os.fstat(fd).st_size
+            if size > 64 * 1024 * 1024:
+                return None
+            if size > 0:
+                # ACCESS_READ is the portable read-only mapping flag;
+                # prot=PROT_READ only exists on POSIX
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if b"\x00" in mm[:8192]:
+                        return None
+                    for offset in range(0, size, 1024 * 1024):
+                        line_count += mm[offset : offset + 1024 * 1024].count(
+                            b"\n"
+                        )
+                    # Count a trailing line that doesn't end with a newline
+                    if mm[-1:] != b"\n":
+                        line_count += 1
+        except (OSError, ValueError):
+            return None
+        finally:
+            os.close(fd)
+
+        return (file_path, line_count)
+
     def get_basic_info(self) -> Dict:
         """Get basic information about the repository."""
         try:
@@ -52,23 +426,23 @@ class Codebase:
             # Get the default branch
             default_branch = self.repo.active_branch.name
 
-            # Get the first and last commit dates
-            commits = list(self.repo.iter_commits())
+            # Get the first and last commit dates without materializing
+            # every commit object; rev-list answers each in one cheap call
+            first_sha = self.repo.git.rev_list(
+                "--max-parents=0", "HEAD"
+            ).split()[0]
             first_commit_date = datetime.fromtimestamp(
-                commits[-1].committed_date
+                int(self.repo.git.show("-s", "--format=%ct", first_sha))
             ).isoformat()
             last_commit_date = datetime.fromtimestamp(
-                commits[0].committed_date
+                int(self.repo.git.show("-s", "--format=%ct", "HEAD"))
             ).isoformat()
 
             # Count total commits
-            total_commits = len(commits)
+            total_commits = int(self.repo.git.rev_list("--count", "HEAD"))
 
             # Count total files (excluding specified files)
-            files = self.repo.git.ls_files().split("\n")
-            total_files = sum(
-                1 for f in files if f and not self._should_exclude_file(f)
-            )
+            total_files = len(self._get_files())
 
             return {
                 "name": Path(self.path).name,
@@ -84,108 +458,169 @@ class Codebase:
             self.console.print(f"[red]Error getting repository info: {str(e)}")
             return {}
 
-    def get_language_stats(self) -> Dict[str, int]:
-        """Get statistics about programming languages in the repository."""
-        languages = {}
+    def get_combined_stats(self, collect_loc: bool = True) -> Dict:
+        """Get language file counts and LOC statistics in a single pass.
+
+        Iterating the tracked files once and computing file-count and
+        line-count aggregates in lockstep halves the path-parsing work
+        compared to calling `get_language_stats` and
+        `get_lines_of_code_stats` separately.
+
+        Args:
+            collect_loc: Whether to also stream file contents for line
+                counts (the expensive part)
+
+        Returns:
+            Dict with "language_files" (files per language) and "loc"
+            (same shape as `get_lines_of_code_stats`)
+        """
+        combined = {
+            "language_files": {},
+            "loc": {
+                "total_lines": 0,
+                "by_language": {},
+                "by_file_type": {},
+                "code_files": 0,
+                "non_code_files": 0,
+            },
+        }
 
         try:
-            # Get all files in the repository
-            files = self.repo.git.ls_files().split("\n")
+            files = self._get_files()
+            extensions = self._file_extensions
 
+            language_files = Counter()
             for file_path in files:
-                if file_path and not self._should_exclude_file(file_path):
-                    # Get the file extension
-                    ext = Path(file_path).suffix.lower()
-
-                    # Map extensions to languages
-                    language = self._map_extension_to_language(ext)
+                language_files[
+                    _EXT_TO_LANG.get(extensions[file_path], "Other")
+                ] += 1
+            combined["language_files"] = dict(
+                sorted(language_files.items(), key=lambda x: x[1], reverse=True)
+            )
 
-                    # Update language count
-                    languages[language] = languages.get(language, 0) + 1
+            if collect_loc:
+                loc_stats = combined["loc"]
+                with ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) * 4)
+                ) as executor:
+                    for result in executor.map(
+                        self._count_lines, files, chunksize=64
+                    ):
+                        if result is None:
+                            continue
+                        file_path, line_count = result
+                        if line_count == 0:
+                            continue
+
+                        ext = extensions[file_path]
+                        language = _EXT_TO_LANG.get(ext, "Other")
+
+                        # Update total lines
+                        loc_stats["total_lines"] += line_count
+
+                        # Update language stats
+                        loc_stats["by_language"][language] = (
+                            loc_stats["by_language"].get(language, 0) + line_count
+                        )
+
+                        # Update file type stats
+                        if ext in _CODE_EXTS or ext == "":
+                            loc_stats["code_files"] += 1
+                            loc_stats["by_file_type"][ext or "no_extension"] = (
+                                loc_stats["by_file_type"].get(
+                                    ext or "no_extension", 0
+                                )
+                                + line_count
+                            )
+                        else:
+                            loc_stats["non_code_files"] += 1
+
+                # Sort language stats by line count
+                loc_stats["by_language"] = dict(
+                    sorted(
+                        loc_stats["by_language"].items(),
+                        key=lambda x: x[1],
+                        reverse=True,
+                    )
+                )
         except Exception as e:
-            self.console.print(f"[red]Error analyzing languages: {str(e)}")
+            self.console.print(f"[red]Error analyzing codebase stats: {str(e)}")
 
-        return dict(sorted(languages.items(), key=lambda x: x[1], reverse=True))
+        return combined
+
+    def get_language_stats(self) -> Dict[str, int]:
+        """Get statistics about programming languages in the repository."""
+        return self.get_combined_stats(collect_loc=False)["language_files"]
 
     def get_lines_of_code_stats(self) -> Dict:
         """Get comprehensive lines of code statistics for the repository."""
-        loc_stats = {
-            "total_lines": 0,
-            "by_language": {},
-            "by_file_type": {},
-            "code_files": 0,
-            "non_code_files": 0,
-        }
-        
-        # Define file types that are typically considered "code"
-        code_extensions = {
-            ".py", ".js", ".jsx", ".ts", ".tsx", ".java", ".cpp", ".c", ".h", 
-            ".cs", ".rb", ".php", ".go", ".rs", ".swift", ".kt", ".scala", 
-            ".r", ".m", ".sh", ".bash", ".sql", ".html", ".css", ".scss", 
-            ".sass", ".less", ".xml", ".yaml", ".yml", ".json", ".toml"
+        return self.get_combined_stats()["loc"]
+
+    def _activity_cache_path(self) -> Path:
+        """Get the path of the on-disk commit-activity cache."""
+        return Path(self.path) / ".git" / "gitpulse-cache" / "activity.json"
+
+    @staticmethod
+    def _activity_from_cache(cached: Dict) -> Dict:
+        """Rebuild an activity dict from its JSON form.
+
+        JSON serializes the integer day-of-week and hour keys as strings,
+        so they're converted back here.
+        """
+        activity = cached["activity"]
+        return {
+            "by_month": dict(activity["by_month"]),
+            "by_day_of_week": {
+                int(k): v for k, v in activity["by_day_of_week"].items()
+            },
+            "by_hour": {int(k): v for k, v in activity["by_hour"].items()},
         }
-        
-        try:
-            # Get all files in the repository
-            files = self.repo.git.ls_files().split("\n")
-            filtered_files = [f for f in files if f and not self._should_exclude_file(f)]
-            
-            for file_path in filtered_files:
-                if not file_path:
-                    continue
-                    
-                try:
-                    file_full_path = Path(self.path, file_path)
-                    if not file_full_path.exists():
-                        continue
-                    
-                    # Count lines in the file
-                    with open(file_full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        line_count = sum(1 for _ in f)
-                    
-                    if line_count == 0:
-                        continue
-                    
-                    # Get file extension and language
-                    ext = Path(file_path).suffix.lower()
-                    language = self._map_extension_to_language(ext)
-                    
-                    # Update total lines
-                    loc_stats["total_lines"] += line_count
-                    
-                    # Update language stats
-                    loc_stats["by_language"][language] = loc_stats["by_language"].get(language, 0) + line_count
-                    
-                    # Update file type stats
-                    if ext in code_extensions or ext == "":
-                        loc_stats["code_files"] += 1
-                        loc_stats["by_file_type"][ext or "no_extension"] = loc_stats["by_file_type"].get(ext or "no_extension", 0) + line_count
-                    else:
-                        loc_stats["non_code_files"] += 1
-                        
-                except Exception:
-                    # Skip files that can't be read
-                    continue
-                    
-        except Exception as e:
-            self.console.print(f"[red]Error analyzing lines of code: {str(e)}")
-        
-        # Sort language stats by line count
-        loc_stats["by_language"] = dict(sorted(loc_stats["by_language"].items(), key=lambda x: x[1], reverse=True))
-        
-        return loc_stats
 
     def get_commit_activity(self) -> Dict:
-        """Get commit activity over time."""
+        """Get commit activity over time.
+
+        Results are cached on disk keyed by the HEAD SHA. With a warm
+        cache whose head is an ancestor of the current HEAD, only the new
+        commits are walked and merged into the cached counts; otherwise
+        the full history is recomputed.
+        """
         activity = {
             "by_month": {},
             "by_day_of_week": {0: 0, 1: 0, 2: 0, 3: 0, 4: 0, 5: 0, 6: 0},
             "by_hour": {h: 0 for h in range(24)},
         }
 
+        head = None
+        try:
+            head = self.repo.head.commit.hexsha
+        except (ValueError, git.GitError):
+            pass
+
+        cached = None
+        if head is not None:
+            try:
+                with open(self._activity_cache_path()) as f:
+                    cached = json.load(f)
+            except (OSError, ValueError, KeyError):
+                cached = None
+
+        if cached and cached.get("head") == head:
+            return self._activity_from_cache(cached)
+
+        rev_range = None
+        if cached and head is not None:
+            try:
+                if self.repo.is_ancestor(cached["head"], head):
+                    # Incremental update: walk only the new commits and
+                    # merge them into the cached counts
+                    activity = self._activity_from_cache(cached)
+                    rev_range = f"{cached['head']}..HEAD"
+            except git.GitError:
+                pass
+
         try:
-            for commit in self.repo.iter_commits():
-                date = datetime.fromtimestamp(commit.committed_date)
+            for timestamp, _ in self._iter_log_stream(rev_range):
+                date = datetime.fromtimestamp(timestamp)
 
                 # By month
                 month_key = f"{date.year}-{date.month:02d}"
@@ -201,6 +636,16 @@ class Codebase:
                 activity["by_hour"][date.hour] += 1
         except Exception as e:
             self.console.print(f"[red]Error analyzing commit activity: {str(e)}")
+            return activity
+
+        if head is not None:
+            try:
+                cache_path = self._activity_cache_path()
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "w") as f:
+                    json.dump({"head": head, "activity": activity}, f)
+            except OSError:
+                pass
 
         return activity
 
@@ -214,59 +659,39 @@ class Codebase:
         }
 
         try:
-            # Get all files
-            files = self.repo.git.ls_files().split("\n")
-            # Filter out excluded files
-            filtered_files = [
-                f for f in files if f and not self._should_exclude_file(f)
-            ]
+            # Get all files (already filtered for exclusions)
+            filtered_files = self._get_files()
             stats["file_count"] = len(filtered_files)
 
-            # Count by extension
-            for file_path in filtered_files:
-                if file_path:
-                    ext = Path(file_path).suffix.lower() or "no_extension"
-                    stats["by_extension"][ext] = stats["by_extension"].get(ext, 0) + 1
-
-            # Get largest files (by line count)
-            file_sizes = []
-            for file_path in filtered_files:
-                if file_path and Path(self.path, file_path).exists():
-                    try:
-                        with open(
-                            Path(self.path, file_path),
-                            "r",
-                            encoding="utf-8",
-                            errors="ignore",
-                        ) as f:
-                            line_count = sum(1 for _ in f)
-                            file_sizes.append((file_path, line_count))
-                    except:
-                        # Skip files that can't be read
-                        pass
+            # Count by extension, pre-sorted descending so display code
+            # doesn't have to re-sort
+            by_extension = Counter(
+                self._file_extensions[f] or "no_extension"
+                for f in filtered_files
+            )
+            stats["by_extension"] = dict(by_extension.most_common())
+
+            # Get largest files (by line count); only files on disk
+            # matter here, so walk the worktree directly and fan the
+            # per-file counting out across a thread pool
+            with ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4)
+            ) as executor:
+                file_sizes = [
+                    result
+                    for result in executor.map(
+                        self._count_lines, self._walk_worktree(), chunksize=64
+                    )
+                    if result is not None
+                ]
 
             # Sort by size and get top 10
             stats["largest_files"] = sorted(
                 file_sizes, key=lambda x: x[1], reverse=True
             )[:10]
 
-            # Get most changed files
-            file_changes = {}
-            for commit in self.repo.iter_commits():
-                if commit.parents:
-                    diffs = commit.parents[0].diff(commit)
-                    for diff in diffs:
-                        if diff.a_path:
-                            file_changes[diff.a_path] = (
-                                file_changes.get(diff.a_path, 0) + 1
-                            )
-
-            # Sort by change count and get top 10
-            stats["most_changed_files"] = sorted(
-                [(path, count) for path, count in file_changes.items()],
-                key=lambda x: x[1],
-                reverse=True,
-            )[:10]
+            # Get most changed files from a single log pass
+            stats["most_changed_files"] = self._count_path_changes().most_common(10)
         except Exception as e:
             self.console.print(f"[red]Error analyzing file stats: {str(e)}")
 
@@ -274,10 +699,21 @@ class Codebase:
 
     def display_codebase_stats(self):
         """Display codebase statistics in a formatted table."""
-        info = self.get_basic_info()
-        languages = self.get_language_stats()
-        file_stats = self.get_file_stats()
-        loc_stats = self.get_lines_of_code_stats()
+        from rich.table import Table
+
+        # The analysis methods share no mutable state and spend most of
+        # their time in git subprocesses and file I/O, so run them
+        # concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            info_future = executor.submit(self.get_basic_info)
+            combined_future = executor.submit(self.get_combined_stats)
+            file_stats_future = executor.submit(self.get_file_stats)
+            info = info_future.result()
+            combined = combined_future.result()
+            file_stats = file_stats_future.result()
+
+        languages = combined["language_files"]
+        loc_stats = combined["loc"]
 
         # Basic info table
         info_table = Table(title="Repository Information")
@@ -332,12 +768,8 @@ class Codebase:
 
         file_table.add_row("Total Files", str(file_stats["file_count"]))
 
-        # Add top 5 extensions
-        extensions = sorted(
-            [(ext, count) for ext, count in file_stats["by_extension"].items()],
-            key=lambda x: x[1],
-            reverse=True,
-        )[:5]
+        # Add top 5 extensions (by_extension is already sorted descending)
+        extensions = list(islice(file_stats["by_extension"].items(), 5))
 
         ext_str = ", ".join([f"{ext} ({count})" for ext, count in extensions])
         file_table.add_row("Top Extensions", ext_str)
@@ -366,41 +798,4 @@ class Codebase:
 
     def _map_extension_to_language(self, ext: str) -> str:
         """Map file extension to programming language."""
-        extension_map = {
-            ".py": "Python",
-            ".js": "JavaScript",
-            ".jsx": "JavaScript",
-            ".ts": "TypeScript",
-            ".tsx": "TypeScript",
-            ".java": "Java",
-            ".cpp": "C++",
-            ".c": "C",
-            ".h": "C/C++",
-            ".cs": "C#",
-            ".rb": "Ruby",
-            ".php": "PHP",
-            ".go": "Go",
-            ".rs": "Rust",
-            ".swift": "Swift",
-            ".kt": "Kotlin",
-            ".scala": "Scala",
-            ".r": "R",
-            ".m": "MATLAB",
-            ".sh": "Shell",
-            ".bash": "Shell",
-            ".bat": "Batch",
-            ".ps1": "PowerShell",
-            ".ipynb": "Jupyter Notebook",
-            ".cmd": "Command Prompt",
-            ".sql": "SQL",
-            ".html": "HTML",
-            ".css": "CSS",
-            ".md": "Markdown",
-            ".json": "JSON",
-            ".yaml": "YAML",
-            ".yml": "YAML",
-            ".xml": "XML",
-            ".txt": "Text",
-        }
-
-        return extension_map.get(ext, "Other")
+        return _EXT_TO_LANG.get(ext, "Other")
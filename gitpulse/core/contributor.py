@@ -1,16 +1,22 @@
+from collections import Counter
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class ContributorStats:
-    """Statistics for an individual contributor."""
+    """Statistics for an individual contributor.
+
+    Slotted so each instance skips the per-object __dict__; repositories
+    can have thousands of contributors and the stats objects sit in hot
+    aggregation loops.
+    """
     name: str
     email: str
     commit_count: int
     lines_added: int
     lines_deleted: int
     files_changed: int
-    languages: Dict[str, int]
+    languages: Counter = field(default_factory=Counter)
     issues: int = 0
     pull_requests: int = 0
     
@@ -49,7 +55,7 @@ class Contributor:
             lines_added=0,
             lines_deleted=0,
             files_changed=0,
-            languages={}
+            languages=Counter()
         )
     
     def update_stats(self, 
@@ -71,16 +77,18 @@ class Contributor:
             issues: Number of issues created
             pull_requests: Number of pull requests created
         """
-        self.stats.commit_count += commit_count
-        self.stats.lines_added += lines_added
-        self.stats.lines_deleted += lines_deleted
-        self.stats.files_changed += files_changed
-        self.stats.issues += issues
-        self.stats.pull_requests += pull_requests
+        stats = self.stats
+        stats.commit_count += commit_count
+        stats.lines_added += lines_added
+        stats.lines_deleted += lines_deleted
+        stats.files_changed += files_changed
+        stats.issues += issues
+        stats.pull_requests += pull_requests
         
         if languages:
-            for lang, count in languages.items():
-                self.stats.languages[lang] = self.stats.languages.get(lang, 0) + count
+            # Counter.update adds counts in C instead of a Python-level
+            # two-lookup merge per key
+            stats.languages.update(languages)
     
     def to_dict(self) -> Dict:
         """Convert contributor stats to dictionary."""
@@ -1,30 +1,77 @@
+import functools
+import heapq
+import subprocess
+import sys
+from operator import itemgetter
+from collections import Counter
 from typing import Dict, List, Optional
 import git
 from git import Repo
-from rich.console import Console
-from rich.table import Table
 from pathlib import Path
 from .contributor import Contributor, ContributorStats
 
+# Map file extensions to languages; module-level so detection is a single
+# O(1) dict lookup instead of a linear endswith scan per filename
+_EXT_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.h': 'C/C++',
+    '.cs': 'C#',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.m': 'MATLAB',
+    '.sh': 'Shell',
+    '.sql': 'SQL',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.md': 'Markdown',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.xml': 'XML',
+    '.txt': 'Text',
+}
+
+# Lock files whose generated churn would swamp real contributions;
+# frozenset gives O(1) membership in the per-file exclusion check
+_EXCLUDED_FILES = frozenset({
+    "package-lock.json",
+    "yarn.lock",
+})
+
 class ContributorAnalyzer:
     """Class for analyzing contributors to a repository."""
-    
+
     def __init__(self, repo: Repo):
         """Initialize the contributor analyzer.
-        
+
         Args:
             repo: Git repository object
         """
         self.repo = repo
-        self.console = Console()
         self.contributors: Dict[str, Contributor] = {}
-        
+
         # Files to exclude from analysis
-        self.excluded_files = [
-            "package-lock.json",
-            "yarn.lock"
-        ]
-    
+        self.excluded_files = _EXCLUDED_FILES
+
+    @functools.cached_property
+    def console(self) -> "Console":
+        """Rich console, imported and built on first render."""
+        from rich.console import Console
+        return Console()
+
     def _should_exclude_file(self, file_path: str) -> bool:
         """Check if a file should be excluded from analysis.
         
@@ -38,54 +85,111 @@ class ContributorAnalyzer:
         return file_name in self.excluded_files
     
     def analyze(self) -> List[Contributor]:
-        """Analyze all contributors to the repository."""
+        """Analyze all contributors to the repository.
+
+        Streams a single `git log --numstat` pipe instead of forking one
+        `git diff` subprocess per commit: header lines switch the current
+        contributor and the numstat lines that follow update their stats.
+        Merge commits emit no numstat, so branch work isn't double-counted
+        when it lands.
+        """
         try:
-            # Process all commits
-            for commit in self.repo.iter_commits():
-                author = commit.author
-                email = author.email
-                
-                # Create contributor if not exists
-                if email not in self.contributors:
-                    self.contributors[email] = Contributor(author.name, email)
-                
-                # Update commit count
-                self.contributors[email].update_stats(commit_count=1)
-                
-                # Get diff stats if commit has parents
-                if commit.parents:
-                    # Get the diff between this commit and its parent
-                    diff = self.repo.git.diff(
-                        commit.parents[0].hexsha,
-                        commit.hexsha,
-                        '--numstat'
-                    ).split('\n')
-                    
-                    # Process each changed file
-                    for line in diff:
-                        if line.strip():
-                            try:
-                                # Parse numstat output: additions deletions filename
-                                additions, deletions, filename = line.split('\t')
-                                
-                                # Skip excluded files
-                                if self._should_exclude_file(filename):
-                                    continue
-                                
-                                # Update contributor stats
-                                self.contributors[email].update_stats(
-                                    lines_added=int(additions) if additions != '-' else 0,
-                                    lines_deleted=int(deletions) if deletions != '-' else 0,
-                                    files_changed=1,
-                                    languages={self._detect_language(filename): 1}
-                                )
-                            except (ValueError, IndexError):
-                                # Skip malformed lines
-                                continue
-            
+            proc = subprocess.Popen(
+                [
+                    'git',
+                    '-C',
+                    self.repo.working_dir,
+                    'log',
+                    '--numstat',
+                    '--no-renames',
+                    '--format=%H%x01%ae%x01%an',
+                ],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1 << 20,
+            )
+
+            # Bind hot lookups to locals: the loop body runs once per
+            # file-edit across the whole history
+            contributors = self.contributors
+            should_exclude = self._should_exclude_file
+            detect_language = self._detect_language
+
+            # Accumulate each commit's numstat block into locals and flush
+            # with one update_stats call per commit, instead of paying the
+            # full update (plus a throwaway one-entry languages dict) per
+            # file-edit
+            current = None
+            adds = dels = files = 0
+            langs = Counter()
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip('\n')
+                    if not line:
+                        continue
+
+                    if '\x01' in line:
+                        # Header line: flush the previous commit and
+                        # switch the current contributor
+                        if current is not None:
+                            current.update_stats(
+                                commit_count=1,
+                                lines_added=adds,
+                                lines_deleted=dels,
+                                files_changed=files,
+                                languages=langs if langs else None
+                            )
+                        _, email, name = line.split('\x01')
+                        # Intern the email so the dict key is the shared
+                        # string object and look it up once instead of a
+                        # membership test followed by a second hash
+                        email = sys.intern(email)
+                        current = contributors.get(email)
+                        if current is None:
+                            current = contributors[email] = Contributor(name, email)
+                        adds = dels = files = 0
+                        langs = Counter()
+                        continue
+
+                    if current is None:
+                        continue
+
+                    # Parse numstat output: additions deletions filename
+                    parts = line.split('\t', 2)
+                    if len(parts) != 3:
+                        continue
+                    additions, deletions, filename = parts
+
+                    # Skip excluded files
+                    if should_exclude(filename):
+                        continue
+
+                    try:
+                        adds += int(additions) if additions != '-' else 0
+                        dels += int(deletions) if deletions != '-' else 0
+                    except ValueError:
+                        # Skip malformed lines
+                        continue
+                    files += 1
+                    langs[detect_language(filename)] += 1
+
+                # Flush the final commit
+                if current is not None:
+                    current.update_stats(
+                        commit_count=1,
+                        lines_added=adds,
+                        lines_deleted=dels,
+                        files_changed=files,
+                        languages=langs if langs else None
+                    )
+            finally:
+                proc.stdout.close()
+                proc.wait()
+
             # Calculate percentages
             self._calculate_percentages()
-            
+
             return list(self.contributors.values())
         except Exception as e:
             self.console.print(f"[red]Error analyzing contributors: {str(e)}")
@@ -93,15 +197,17 @@ class ContributorAnalyzer:
     
     def get_top_contributors(self, limit: int = 10) -> List[Contributor]:
         """Get top contributors by total changes."""
-        contributors = list(self.contributors.values())
-        return sorted(
-            contributors,
-            key=lambda c: c.stats.total_changes,
-            reverse=True
-        )[:limit]
+        # O(N log limit) instead of sorting all N contributors
+        return heapq.nlargest(
+            limit,
+            self.contributors.values(),
+            key=lambda c: c.stats.total_changes
+        )
     
     def display_contributor_stats(self):
         """Display contributor statistics in a formatted table."""
+        from rich.table import Table
+
         # Analyze contributors if not already done
         if not self.contributors:
             self.analyze()
@@ -125,19 +231,18 @@ class ContributorAnalyzer:
             reverse=True
         )
         
-        # Add rows for each contributor
+        # Format all rows up front, then feed the table in one tight loop
+        rows = []
         for contributor in sorted_contributors:
             stats = contributor.stats
-            
+
             # Get top 3 languages
-            top_languages = sorted(
-                stats.languages.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:3]
+            top_languages = heapq.nlargest(
+                3, stats.languages.items(), key=itemgetter(1)
+            )
             top_langs_str = ", ".join(f"{lang}({count})" for lang, count in top_languages)
-            
-            table.add_row(
+
+            rows.append((
                 stats.name,
                 stats.email,
                 str(stats.commit_count),
@@ -147,55 +252,30 @@ class ContributorAnalyzer:
                 str(stats.total_changes),
                 f"{stats.percentage:.1f}%",
                 top_langs_str
-            )
-        
+            ))
+
+        for row in rows:
+            table.add_row(*row)
+
         self.console.print(table)
     
     def _calculate_percentages(self):
         """Calculate percentage contributions for all contributors."""
-        total_changes = sum(c.stats.total_changes for c in self.contributors.values())
-        
-        for contributor in self.contributors.values():
-            contributor.stats.calculate_percentage(total_changes)
+        # Read each total_changes property exactly once and reuse the
+        # value for both the grand total and the per-contributor share
+        totals = [(c.stats, c.stats.total_changes) for c in self.contributors.values()]
+        grand_total = sum(changes for _, changes in totals)
+
+        for stats, changes in totals:
+            stats.percentage = (changes / grand_total) * 100 if grand_total else 0.0
     
-    def _detect_language(self, filename: str) -> str:
-        """Detect programming language from filename."""
-        # Map file extensions to languages
-        extension_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.jsx': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.tsx':'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.h': 'C/C++',
-            '.cs': 'C#',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.r': 'R',
-            '.m': 'MATLAB',
-            '.sh': 'Shell',
-            '.sql': 'SQL',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.md': 'Markdown',
-            '.json': 'JSON',
-            '.yaml': 'YAML',
-            '.yml': 'YAML',
-            '.xml': 'XML',
-            '.txt': 'Text',
-        }
-        
-        ext = Path(filename).suffix.lower()
-        for extension, language in extension_map.items():
-            if ext.endswith(extension):
-                return language
-        
-        return 'Unknown' 
\ No newline at end of file
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def _detect_language(filename: str) -> str:
+        """Detect programming language from filename.
+
+        Memoized: the same paths recur across commits (README.md,
+        src/main.py, ...), so the PurePath suffix parsing usually short-
+        circuits to a cache hit.
+        """
+        return _EXT_MAP.get(Path(filename).suffix.lower(), 'Unknown')
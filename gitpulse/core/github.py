@@ -1,11 +1,97 @@
+import asyncio
+import hashlib
+import itertools
+import orjson
 import os
+import httpx
 import requests
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-@dataclass
+class TokenBucket:
+    """Client-side token-bucket rate limiter.
+
+    Smooths request bursts so we stay under GitHub's abuse-detection
+    (secondary) limits instead of hitting 403s and retrying.
+    """
+
+    def __init__(self, capacity: float, rate: float, initial: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            rate: Token refill rate per second
+            initial: Starting token count; defaults to capacity. Start
+                low when the capacity reflects an hourly budget, or the
+                first burst passes entirely unthrottled.
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity if initial is None else min(initial, capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self, n: int = 1) -> bool:
+        """Try to take n tokens from the bucket.
+
+        Returns:
+            True if the tokens were available, False otherwise
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens >= n:
+                self.tokens -= n
+                return True
+            return False
+
+    def wait(self, n: int = 1) -> None:
+        """Block until n tokens are available."""
+        while not self.take(n):
+            time.sleep(0.05)
+
+# Map file extensions to languages; module-level so detection is a single
+# O(1) dict lookup instead of a linear endswith scan per filename
+_EXT_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.h': 'C/C++',
+    '.cs': 'C#',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.m': 'MATLAB',
+    '.sh': 'Shell',
+    '.sql': 'SQL',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.md': 'Markdown',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.xml': 'XML',
+    '.txt': 'Text',
+}
+
+@dataclass(slots=True)
 class GitHubContributor:
     name: str
     email: str
@@ -23,25 +109,234 @@ class GitHubContributor:
 class GitHubClient:
     def __init__(self, token: Optional[str] = None):
         """Initialize GitHub API client.
-        
+
         Args:
-            token: GitHub personal access token (optional)
+            token: GitHub personal access token(s), comma-separated to
+                round-robin multiple tokens across requests (optional)
         """
-        self.token = token or os.getenv('GITHUB_TOKEN')
+        raw_tokens = token or os.getenv('GITHUB_TOKEN') or ''
+        self.tokens = [t.strip() for t in raw_tokens.split(',') if t.strip()]
+        self.token = self.tokens[0] if self.tokens else None
+        self._token_pool = itertools.cycle(self.tokens) if len(self.tokens) > 1 else None
         self.headers = {
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'GitPulse'
         }
         if self.token:
             self.headers['Authorization'] = f'token {self.token}'
-    
+
+        # Persistent session so keep-alive reuses TCP/TLS connections
+        # across requests instead of re-handshaking per call
+        self.session = requests.Session()
+
+        # ETag cache keyed by (url, params): conditional requests that
+        # come back 304 reuse the cached body and cost almost nothing
+        # against the rate limit
+        self._etag_cache = {}
+
+        # On-disk response cache so repeat runs skip the network while an
+        # entry is fresh and revalidate (cheap 304) after it expires;
+        # GITPULSE_CACHE_TTL overrides the default one-hour lifetime,
+        # zero disables disk caching
+        self._cache_ttl = float(os.getenv('GITPULSE_CACHE_TTL', 3600))
+        self._disk_cache_dir = Path(os.path.expanduser('~')) / '.gitpulse-cache'
+        try:
+            self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            self._disk_cache_dir = None
+
+        # GitHub allows 5000 requests/hour per token; scale the budget by
+        # the number of tokens in the rotation pool. Starting well below
+        # capacity makes the bucket smooth the opening burst too instead
+        # of waving the first few thousand requests straight through
+        budget = 5000 * max(1, len(self.tokens))
+        self._bucket = TokenBucket(capacity=budget, rate=budget / 3600.0, initial=100)
+
+        # Global in-flight cap shared by every request path — sync,
+        # async and GraphQL alike. Nested worker pools multiply their
+        # sizes (10 contributor pipelines x 16 detail fetches), so the
+        # cap has to sit at the request level, not the pool level, to
+        # keep total concurrency inside GitHub's secondary limits
+        self._concurrency = threading.BoundedSemaphore(10)
+
+    def _request_headers(self) -> Dict:
+        """Get headers for the next request, rotating tokens if configured.
+
+        With multiple tokens the effective rate budget scales linearly,
+        since GitHub's rate limit is tracked per token.
+        """
+        if self._token_pool is None:
+            return self.headers
+        headers = dict(self.headers)
+        headers['Authorization'] = f'token {next(self._token_pool)}'
+        return headers
+
+    def _cache_key(self, url: str, params: Optional[Dict]) -> tuple:
+        """Build the ETag-cache key for a request."""
+        return (url, tuple(sorted(params.items())) if params else None)
+
+    def _disk_cache_path(self, key: tuple) -> Path:
+        """Build the on-disk cache file path for a request key."""
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self._disk_cache_dir / f'{digest}.json'
+
+    def _disk_cache_get(self, key: tuple) -> Optional[Dict]:
+        """Load a cached entry ({ts, etag, body}) from disk, if any."""
+        if self._disk_cache_dir is None or self._cache_ttl <= 0:
+            return None
+        try:
+            return orjson.loads(self._disk_cache_path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _disk_cache_put(self, key: tuple, etag: Optional[str], body) -> None:
+        """Persist a response body (and its ETag) to the disk cache."""
+        if self._disk_cache_dir is None or self._cache_ttl <= 0:
+            return
+        try:
+            self._disk_cache_path(key).write_bytes(
+                orjson.dumps({'ts': time.time(), 'etag': etag, 'body': body})
+            )
+        except (OSError, TypeError):
+            pass
+
+    def _get_with_backoff(self, url: str, headers: Dict, params: Optional[Dict] = None):
+        """GET with rate-limit-aware retries.
+
+        Rate-limited responses (429, or 403 carrying Retry-After or an
+        exhausted X-RateLimit-Remaining) honor Retry-After, then the
+        X-RateLimit-Reset window, then capped exponential back-off
+        (1s, 2s, 4s, 8s), and rotate to the next token in the pool
+        before retrying so a throttled token doesn't stall the whole
+        run. Other 403s — bad token, missing permissions — return
+        immediately; sleeping through retries can't fix those.
+        """
+        delay = 1.0
+        response = None
+        for attempt in range(5):
+            self._bucket.wait()
+            # Hold the global in-flight slot only for the request
+            # itself, never across back-off sleeps
+            with self._concurrency:
+                response = self.session.get(url, headers=headers, params=params)
+            if response.status_code not in (403, 429):
+                return response
+            if response.status_code == 403 and not (
+                response.headers.get('Retry-After')
+                or response.headers.get('X-RateLimit-Remaining') == '0'
+            ):
+                return response
+            if attempt == 4:
+                break
+
+            wait = delay
+            retry_after = response.headers.get('Retry-After')
+            reset = response.headers.get('X-RateLimit-Reset')
+            if retry_after:
+                try:
+                    wait = float(retry_after)
+                except ValueError:
+                    pass
+            elif response.headers.get('X-RateLimit-Remaining') == '0' and reset:
+                try:
+                    wait = max(0.0, float(reset) - time.time())
+                except ValueError:
+                    pass
+
+            if self._token_pool is not None:
+                headers = dict(headers)
+                headers['Authorization'] = f'token {next(self._token_pool)}'
+
+            time.sleep(wait)
+            delay = min(delay * 2, 8.0)
+        return response
+
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make a request to the GitHub API."""
+        """Make a request to the GitHub API.
+
+        Sends If-None-Match when a cached ETag exists; a 304 response
+        short-circuits to the cached body.
+        """
         url = f'https://api.github.com{endpoint}'
-        response = requests.get(url, headers=self.headers, params=params)
+        key = self._cache_key(url, params)
+        cached = self._etag_cache.get(key)
+
+        if cached is None:
+            entry = self._disk_cache_get(key)
+            if entry is not None:
+                if time.time() - entry.get('ts', 0) < self._cache_ttl:
+                    # Fresh on disk: serve it without touching the network
+                    if entry.get('etag'):
+                        self._etag_cache[key] = (entry['etag'], entry['body'])
+                    return entry['body']
+                if entry.get('etag'):
+                    # Stale: revalidate with the stored ETag below
+                    cached = (entry['etag'], entry['body'])
+
+        headers = self._request_headers()
+        if cached is not None:
+            headers = dict(headers)
+            headers['If-None-Match'] = cached[0]
+
+        response = self._get_with_backoff(url, headers, params)
+        if response.status_code == 304 and cached is not None:
+            # Unchanged upstream; restamp the disk entry as fresh
+            self._disk_cache_put(key, cached[0], cached[1])
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+
+        # orjson parses large payloads (e.g. /stats/contributors) several
+        # times faster than Response.json()'s stdlib decoder
+        body = orjson.loads(response.content)
+        etag = response.headers.get('ETag')
+        if etag:
+            self._etag_cache[key] = (etag, body)
+        self._disk_cache_put(key, etag, body)
+        return body
     
+    async def _amake_request(self, client: 'httpx.AsyncClient', endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Make an async request to the GitHub API.
+
+        Draws on the same global in-flight semaphore and token bucket
+        as the synchronous paths, so async fan-outs don't stack a
+        second concurrency budget on top of the shared one. The
+        blocking acquire runs in a worker thread to keep the event
+        loop free.
+        """
+        await asyncio.to_thread(self._concurrency.acquire)
+        try:
+            while not self._bucket.take():
+                await asyncio.sleep(0.05)
+            response = await client.get(endpoint, headers=self._request_headers(), params=params)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        finally:
+            self._concurrency.release()
+
+    def _make_requests_parallel(self, endpoints: List[str]) -> List[Dict]:
+        """Fetch several GitHub API endpoints concurrently.
+
+        Serial requests pay one network round trip per endpoint; issuing
+        them through an async client overlaps the latency. Each request
+        takes a slot from the client-wide in-flight semaphore and a
+        token from the shared bucket, so this path counts against the
+        same concurrency ceiling as every other.
+
+        Args:
+            endpoints: List of API endpoint paths to fetch
+
+        Returns:
+            List of JSON responses in the same order as the endpoints
+        """
+        async def _gather():
+            async with httpx.AsyncClient(base_url='https://api.github.com') as client:
+                return list(await asyncio.gather(*(
+                    self._amake_request(client, endpoint)
+                    for endpoint in endpoints
+                )))
+
+        return asyncio.run(_gather())
+
     def _make_request_with_retry(self, endpoint: str, params: Optional[Dict] = None, max_retries: int = 3, retry_delay: int = 2) -> Dict:
         """Make a request to the GitHub API with retry for 202 responses.
         
@@ -51,7 +346,7 @@ class GitHubClient:
         url = f'https://api.github.com{endpoint}'
         
         for attempt in range(max_retries):
-            response = requests.get(url, headers=self.headers, params=params)
+            response = self._get_with_backoff(url, self._request_headers(), params)
             response.raise_for_status()
             
             # If we get a 202, the data is being computed, so we need to retry
@@ -60,19 +355,77 @@ class GitHubClient:
                     time.sleep(retry_delay)
                     continue
             
-            return response.json()
+            return orjson.loads(response.content)
         
         # If we've exhausted all retries and still get 202, return an empty result
         return {}
     
+    def _get_issue_pr_counts(self, owner: str, repo: str, logins: List[str]) -> Dict[str, tuple]:
+        """Fetch issue and PR counts for many contributors in bulk.
+
+        One aliased GraphQL search query covers up to 50 contributors per
+        round trip instead of two REST listings per contributor.
+        Unauthenticated clients fall back to the REST Search API, whose
+        responses carry total_count so no paging is needed.
+
+        Returns:
+            Dict mapping login to an (issues, pull_requests) tuple
+        """
+        counts: Dict[str, tuple] = {}
+        if self.token:
+            try:
+                for start in range(0, len(logins), 50):
+                    batch = logins[start:start + 50]
+                    fields = []
+                    for i, login in enumerate(batch):
+                        fields.append(
+                            f'i{i}: search(query: "repo:{owner}/{repo} author:{login} type:issue", '
+                            'type: ISSUE) { issueCount }'
+                        )
+                        fields.append(
+                            f'p{i}: search(query: "repo:{owner}/{repo} author:{login} type:pr", '
+                            'type: ISSUE) { issueCount }'
+                        )
+                    result = self._make_graphql_request('query { %s }' % ' '.join(fields))
+                    data = result['data']
+                    for i, login in enumerate(batch):
+                        counts[login] = (
+                            data[f'i{i}']['issueCount'],
+                            data[f'p{i}']['issueCount'],
+                        )
+                return counts
+            except (requests.RequestException, KeyError, TypeError):
+                counts.clear()
+
+        for login in logins:
+            issues = self._make_request(
+                '/search/issues',
+                params={'q': f'repo:{owner}/{repo} author:{login} type:issue', 'per_page': 1}
+            )
+            pull_requests = self._make_request(
+                '/search/issues',
+                params={'q': f'repo:{owner}/{repo} author:{login} type:pr', 'per_page': 1}
+            )
+            counts[login] = (
+                issues.get('total_count', 0),
+                pull_requests.get('total_count', 0),
+            )
+        return counts
+
     def get_contributor_stats(self, owner: str, repo: str) -> List[GitHubContributor]:
         """Get contributor statistics for a repository."""
-        # Get repository info for stars, forks, watchers
-        repo_info = self._make_request(f'/repos/{owner}/{repo}')
-        
-        # Get contributors list
-        contributors = self._make_request(f'/repos/{owner}/{repo}/contributors')
-        
+        # Get repository info (stars, forks, watchers) and the contributors
+        # list concurrently
+        repo_info, contributors = self._make_requests_parallel([
+            f'/repos/{owner}/{repo}',
+            f'/repos/{owner}/{repo}/contributors',
+        ])
+
+        # Repo-level constants, hoisted out of the per-contributor loops
+        stars = repo_info['stargazers_count']
+        forks = repo_info['forks_count']
+        watchers = repo_info['watchers_count']
+
         # Get contributor stats with retry for 202 responses
         contributor_stats = self._make_request_with_retry(f'/repos/{owner}/{repo}/stats/contributors')
         
@@ -89,20 +442,48 @@ class GitHubClient:
                     languages={},
                     issues=0,
                     pull_requests=0,
-                    stars=repo_info['stargazers_count'],
-                    forks=repo_info['forks_count'],
-                    watchers=repo_info['watchers_count']
+                    stars=stars,
+                    forks=forks,
+                    watchers=watchers
                 )
                 for contributor in contributors
             ]
         
+        # Index the stats payload by author id once rather than scanning
+        # it per contributor
+        stats_by_id = {
+            stat['author']['id']: stat
+            for stat in contributor_stats
+            if stat.get('author') and 'id' in stat['author']
+        }
+
+        # Batch all issue/PR counts up front; one GraphQL round trip per
+        # 50 contributors instead of two REST listings per contributor
+        issue_pr_counts = self._get_issue_pr_counts(
+            owner, repo, [contributor['login'] for contributor in contributors]
+        )
+
+        # Run the per-contributor language pipelines concurrently rather
+        # than one contributor at a time; each pipeline is network-bound,
+        # and ten in flight stays under GitHub's secondary rate limits
+        logins_with_stats = [
+            contributor['login']
+            for contributor in contributors
+            if stats_by_id.get(contributor['id'])
+        ]
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            languages_by_login = dict(zip(
+                logins_with_stats,
+                executor.map(
+                    lambda login: self._get_contributor_languages(owner, repo, login),
+                    logins_with_stats,
+                ),
+            ))
+
         stats = []
         for contributor in contributors:
             # Find the contributor's stats
-            user_stats = next(
-                (stat for stat in contributor_stats if stat.get('author', {}).get('id') == contributor['id']),
-                None
-            )
+            user_stats = stats_by_id.get(contributor['id'])
             
             if user_stats:
                 # Calculate total changes
@@ -110,19 +491,13 @@ class GitHubClient:
                 total_deletions = sum(week.get('d', 0) for week in user_stats.get('weeks', []))
                 total_commits = sum(week.get('c', 0) for week in user_stats.get('weeks', []))
                 
-                # Get language stats
-                languages = self._get_contributor_languages(owner, repo, contributor['login'])
-                
-                # Get issues and PRs created by the contributor
-                issues = self._make_request(
-                    f'/repos/{owner}/{repo}/issues',
-                    params={'creator': contributor['login'], 'state': 'all'}
-                )
-                pull_requests = self._make_request(
-                    f'/repos/{owner}/{repo}/pulls',
-                    params={'creator': contributor['login'], 'state': 'all'}
-                )
-                
+                # Get language stats from the concurrent prefetch
+                languages = languages_by_login.get(contributor['login'], {})
+
+                # Issues and PRs created by the contributor, from the
+                # batched lookup above
+                issues_count, pr_count = issue_pr_counts.get(contributor['login'], (0, 0))
+
                 # Generate a default email if not available
                 email = f"{contributor['login']}@users.noreply.github.com"
                 
@@ -134,11 +509,11 @@ class GitHubClient:
                     lines_deleted=total_deletions,
                     files_changed=0,  # GitHub API doesn't provide this directly
                     languages=languages,
-                    issues=len(issues),
-                    pull_requests=len(pull_requests),
-                    stars=repo_info['stargazers_count'],
-                    forks=repo_info['forks_count'],
-                    watchers=repo_info['watchers_count']
+                    issues=issues_count,
+                    pull_requests=pr_count,
+                    stars=stars,
+                    forks=forks,
+                    watchers=watchers
                 ))
             else:
                 # If we couldn't find stats for this contributor, use basic info
@@ -152,79 +527,145 @@ class GitHubClient:
                     languages={},
                     issues=0,
                     pull_requests=0,
-                    stars=repo_info['stargazers_count'],
-                    forks=repo_info['forks_count'],
-                    watchers=repo_info['watchers_count']
+                    stars=stars,
+                    forks=forks,
+                    watchers=watchers
                 ))
         
         return stats
     
+    def _make_graphql_request(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        """Make a request to the GitHub GraphQL API.
+
+        GraphQL batches what would be several REST round trips into one
+        request and is priced more cheaply against the rate limit.
+        Requires an authenticated client.
+        """
+        self._bucket.wait()
+        with self._concurrency:
+            response = self.session.post(
+                'https://api.github.com/graphql',
+                headers=self._request_headers(),
+                json={'query': query, 'variables': variables or {}}
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _list_contributor_commits(self, owner: str, repo: str, username: str) -> List[Dict]:
+        """List the contributor's most recent commits via the REST API.
+
+        The server-side author filter is what matters here: a GraphQL
+        history query without one returns the newest commits of the
+        whole branch, which for active repos contains few or none of
+        this contributor's commits and would silently skew the language
+        stats built from them. per_page=100 keeps it to one round trip
+        per contributor.
+
+        Returns:
+            List of dicts with a "sha" key
+        """
+        return self._make_request(
+            f'/repos/{owner}/{repo}/commits',
+            params={'author': username, 'per_page': 100}
+        )
+
     def _get_contributor_languages(self, owner: str, repo: str, username: str) -> Dict[str, int]:
         """Get language statistics for a specific contributor."""
         # Get all commits by the contributor
-        commits = self._make_request(
-            f'/repos/{owner}/{repo}/commits',
-            params={'author': username}
-        )
+        commits = self._list_contributor_commits(owner, repo, username)
         
-        languages = {}
-        for commit in commits:
-            # Get the commit details
-            commit_details = self._make_request(
-                f'/repos/{owner}/{repo}/commits/{commit["sha"]}'
+        # Fetch commit details concurrently; the work is latency-bound on
+        # GitHub round trips, so threads scale despite the GIL
+        languages = defaultdict(int)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            details = executor.map(
+                lambda commit: self._make_request(
+                    f'/repos/{owner}/{repo}/commits/{commit["sha"]}'
+                ),
+                commits,
             )
-            
+
             # Get the files changed
-            for file in commit_details['files']:
-                if file['filename']:
-                    lang = self._detect_language(file['filename'])
-                    languages[lang] = languages.get(lang, 0) + 1
-        
-        return languages
+            for commit_details in details:
+                for file in commit_details.get('files', []):
+                    if file['filename']:
+                        languages[self._detect_language(file['filename'])] += 1
+
+        return dict(languages)
     
     def get_repository_languages(self, owner: str, repo: str) -> Dict[str, int]:
         """Get language statistics for the entire repository."""
         languages = self._make_request(f'/repos/{owner}/{repo}/languages')
         return languages
+
+    # Repository metadata and language sizes in one round trip; the REST
+    # equivalent is two separate calls, each costing a rate-limit point
+    _REPO_OVERVIEW_QUERY = """
+    query($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        name
+        description
+        owner { login }
+        stargazerCount
+        forkCount
+        watchers { totalCount }
+        openIssues: issues(states: OPEN) { totalCount }
+        defaultBranchRef { name }
+        createdAt
+        updatedAt
+        languages(first: 50, orderBy: {field: SIZE, direction: DESC}) {
+          edges { size node { name } }
+        }
+      }
+    }
+    """
+
+    def get_repository_overview(self, owner: str, repo: str) -> tuple:
+        """Get repository metadata and languages in a single round trip.
+
+        Prefers one GraphQL query over the two REST calls
+        (`/repos/:owner/:repo` and `/repos/:owner/:repo/languages`);
+        falls back to the REST pair, issued concurrently, when the
+        client is unauthenticated or the GraphQL response is malformed.
+
+        Returns:
+            Tuple of (repository info dict using REST field names,
+            language-name to byte-count dict)
+        """
+        if self.token:
+            try:
+                result = self._make_graphql_request(
+                    self._REPO_OVERVIEW_QUERY,
+                    {'owner': owner, 'name': repo}
+                )
+                node = result['data']['repository']
+                info = {
+                    'name': node['name'],
+                    'owner': {'login': node['owner']['login']},
+                    'description': node['description'],
+                    'stargazers_count': node['stargazerCount'],
+                    'forks_count': node['forkCount'],
+                    'watchers_count': node['watchers']['totalCount'],
+                    'open_issues_count': node['openIssues']['totalCount'],
+                    'default_branch': (node.get('defaultBranchRef') or {}).get('name', 'Unknown'),
+                    'created_at': node['createdAt'],
+                    'updated_at': node['updatedAt'],
+                }
+                languages = {
+                    edge['node']['name']: edge['size']
+                    for edge in node['languages']['edges']
+                }
+                return info, languages
+            except (requests.RequestException, KeyError, TypeError):
+                pass
+
+        info, languages = self._make_requests_parallel([
+            f'/repos/{owner}/{repo}',
+            f'/repos/{owner}/{repo}/languages',
+        ])
+        return info, languages
     
-    def _detect_language(self, filename: str) -> str:
+    @staticmethod
+    def _detect_language(filename: str) -> str:
         """Detect programming language from filename."""
-        # Map file extensions to languages
-        extension_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.jsx': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.tsx':'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.h': 'C/C++',
-            '.cs': 'C#',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.r': 'R',
-            '.m': 'MATLAB',
-            '.sh': 'Shell',
-            '.sql': 'SQL',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.md': 'Markdown',
-            '.json': 'JSON',
-            '.yaml': 'YAML',
-            '.yml': 'YAML',
-            '.xml': 'XML',
-            '.txt': 'Text',
-        }
-        
-        ext = filename.lower()
-        for extension, language in extension_map.items():
-            if ext.endswith(extension):
-                return language
-        
-        return 'Unknown' 
\ No newline at end of file
+        return _EXT_MAP.get(os.path.splitext(filename)[1].lower(), 'Unknown')
@@ -1,3 +1,11 @@
+import functools
+import heapq
+import os
+import re
+import subprocess
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Optional
 from pathlib import Path
 import git
@@ -5,15 +13,102 @@ from git import Repo
 from datetime import datetime
 import requests
 from dataclasses import dataclass
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress
 from .github import GitHubClient, GitHubContributor
-from .codebase import Codebase
+from .codebase import Codebase, _EXT_TO_LANG
 from .contributor import Contributor
 from .contributor_analyzer import ContributorAnalyzer
+from ..utils.exclusions import FileExclusions
 
-@dataclass
+def _numstat_shard_worker(path: str, shas: List[str]) -> Dict[str, Dict]:
+    """Aggregate numstat totals for one shard of commits.
+
+    Runs in a worker process, so it returns plain dicts of raw counters
+    keyed by author email; the parent merges shards and derives the
+    remaining ContributorStats fields once.
+    """
+    totals: Dict[str, Dict] = {}
+    proc = subprocess.Popen(
+        [
+            'git',
+            '-C',
+            path,
+            'log',
+            '--numstat',
+            '--no-renames',
+            '--no-walk=unsorted',
+            '--stdin',
+            '--pretty=format:%x01%H%x01%ae%x01%an',
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1 << 20,
+    )
+
+    current = None
+    try:
+        proc.stdin.write('\n'.join(shas) + '\n')
+        proc.stdin.close()
+
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+
+            if line.startswith('\x01'):
+                _, _sha, email, name = line.split('\x01')
+                current = totals.get(email)
+                if current is None:
+                    current = totals[email] = {
+                        'name': name,
+                        'commits': 0,
+                        'added': 0,
+                        'deleted': 0,
+                        'files': 0,
+                        'languages': defaultdict(int),
+                    }
+                current['commits'] += 1
+                continue
+
+            if current is None:
+                continue
+
+            try:
+                additions, deletions, filename = line.split('\t', 2)
+                # Same shared exclusion rules as the serial path, so
+                # parallel and serial runs agree on what gets counted
+                if FileExclusions.should_exclude(filename):
+                    continue
+                current['added'] += int(additions)
+                current['deleted'] += int(deletions)
+            except (ValueError, IndexError):
+                continue
+            current['files'] += 1
+            current['languages'][_lang_for_path(filename)] += 1
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+    # Plain dicts across the process boundary
+    for agg in totals.values():
+        agg['languages'] = dict(agg['languages'])
+    return totals
+
+# Accepts https, https-with-.git, trailing-slash, and SSH
+# (git@github.com:owner/repo.git) forms in one precompiled match
+_GH_URL_RE = re.compile(r'github\.com[/:]([^/]+)/([^/]+?)(?:\.git)?/?$')
+
+@functools.lru_cache(maxsize=65536)
+def _lang_for_path(filename: str) -> str:
+    """Map a filename to its language, memoized per distinct path.
+
+    The same paths recur across commits, so the suffix parsing usually
+    short-circuits to a cache hit.
+    """
+    return _EXT_TO_LANG.get(Path(filename).suffix.lower(), 'Other')
+
+@dataclass(slots=True)
 class ContributorStats:
     name: str
     email: str
@@ -27,25 +122,47 @@ class ContributorStats:
     stars: int = 0
     forks: int = 0
     watchers: int = 0
-    changes_count: int = 0
     percentage: float = 0.0
-    total_lines: int = 0
     percentage_lines: float = 0.0
     percentage_languages: float = 0.0
-    total_issues: int = 0
     percentage_issues: float = 0.0
-    total_pull_requests: int = 0
     percentage_pull_requests: float = 0.0
-    total_stars: int = 0
     percentage_stars: float = 0.0
-    total_forks: int = 0
     percentage_forks: float = 0.0
-    
+
     @property
     def total_changes(self) -> int:
         """Calculate total number of changes (additions + deletions)."""
         return self.lines_added + self.lines_deleted
-    
+
+    # Derived totals are properties rather than stored fields: the hot
+    # numstat loop then only writes the raw counters, and the values can
+    # never drift out of sync with their sources. Only the percentage_*
+    # fields remain stored, since they depend on cross-contributor totals.
+    @property
+    def changes_count(self) -> int:
+        return self.lines_added + self.lines_deleted
+
+    @property
+    def total_lines(self) -> int:
+        return self.lines_added + self.lines_deleted
+
+    @property
+    def total_issues(self) -> int:
+        return self.issues
+
+    @property
+    def total_pull_requests(self) -> int:
+        return self.pull_requests
+
+    @property
+    def total_stars(self) -> int:
+        return self.stars
+
+    @property
+    def total_forks(self) -> int:
+        return self.forks
+
     def get_percentage(self, total: int) -> float:
         """Calculate percentage of total changes."""
         if total == 0:
@@ -63,16 +180,13 @@ class Repository:
         self.path = path
         self.is_remote = is_remote
         self.repo = None
-        self.console = Console()
         self.codebase = None
         self.contributor_analyzer = None
-        
-        # Files to exclude from analysis
-        self.excluded_files = [
-            "package-lock.json",
-            "yarn.lock"
-        ]
-        
+
+        # Memoized analysis results; see invalidate()
+        self._contributor_stats_cache = None
+        self._top_languages_cache = None
+
         if not is_remote:
             try:
                 self.repo = Repo(path)
@@ -85,21 +199,36 @@ class Repository:
             self.github_url = path
             self.owner, self.repo_name = self._parse_github_url(path)
             self.github_client = GitHubClient()
-    
+
+    @functools.cached_property
+    def console(self) -> "Console":
+        """Rich console, built on first render rather than at init.
+
+        rich is imported here rather than at module scope so server and
+        library callers that never render skip its import cost.
+        """
+        from rich.console import Console
+        return Console()
+
     def _parse_github_url(self, url: str) -> tuple[str, str]:
         """Parse GitHub URL to get owner and repository name."""
-        parts = url.rstrip('/').split('/')
-        if len(parts) < 4:
+        match = _GH_URL_RE.search(url)
+        if not match:
             raise ValueError("Invalid GitHub URL")
-        return parts[-2], parts[-1]
+        return match.group(1), match.group(2)
     
     def analyze_codebase(self):
         """Analyze the codebase/repository."""
+        from rich.table import Table
+
         if self.is_remote:
             self.console.print("[yellow]Codebase analysis is limited for remote repositories.")
-            # For remote repos, we can only show basic info from GitHub API
-            repo_info = self.github_client._make_request(f'/repos/{self.owner}/{self.repo_name}')
-            
+            # For remote repos, we can only show basic info from GitHub API;
+            # one overview call fetches the metadata and the language sizes
+            repo_info, languages = self.github_client.get_repository_overview(
+                self.owner, self.repo_name
+            )
+
             # Create a table for basic info
             table = Table(title="Repository Information")
             table.add_column("Property", style="cyan")
@@ -118,10 +247,8 @@ class Repository:
             table.add_row("Updated At", repo_info.get('updated_at', 'Unknown'))
             
             self.console.print(table)
-            
+
             # Show language distribution
-            languages = self.github_client._make_request(f'/repos/{self.owner}/{self.repo_name}/languages')
-            
             lang_table = Table(title="Language Distribution")
             lang_table.add_column("Language", style="green")
             lang_table.add_column("Bytes", justify="right")
@@ -139,6 +266,8 @@ class Repository:
     
     def analyze_contributors(self):
         """Analyze contributors to the repository."""
+        from rich.table import Table
+
         if self.is_remote:
             # For remote repos, use the GitHub API
             contributors = self.github_client.get_contributor_stats(self.owner, self.repo_name)
@@ -190,6 +319,8 @@ class Repository:
     
     def analyze(self):
         """Perform complete analysis of the repository."""
+        from rich.progress import Progress
+
         with Progress() as progress:
             task = progress.add_task("[cyan]Analyzing repository...", total=2)
             
@@ -201,104 +332,186 @@ class Repository:
             self.analyze_contributors()
             progress.update(task, advance=1)
     
-    def get_contributor_stats(self) -> List[ContributorStats]:
-        """Get statistics for all contributors."""
-        if self.is_remote:
-            return self._get_remote_contributor_stats()
-        return self._get_local_contributor_stats()
+    def get_contributor_stats(self, parallel: bool = False) -> List[ContributorStats]:
+        """Get statistics for all contributors.
+
+        Args:
+            parallel: Shard local history parsing across CPU cores;
+                worth it on very large histories, pool overhead on small
+                ones
+        """
+        if self._contributor_stats_cache is None:
+            if self.is_remote:
+                self._contributor_stats_cache = self._get_remote_contributor_stats()
+            else:
+                self._contributor_stats_cache = self._get_local_contributor_stats(
+                    parallel=parallel
+                )
+        return self._contributor_stats_cache
     
-    def _should_exclude_file(self, file_path: str) -> bool:
+    @staticmethod
+    def _should_exclude_file(file_path: str) -> bool:
         """Check if a file should be excluded from analysis.
-        
+
         Args:
             file_path: Path to the file
-            
+
         Returns:
             True if the file should be excluded, False otherwise
         """
-        file_name = Path(file_path).name
-        return file_name in self.excluded_files
+        # Delegate to the shared exclusion rules so Repository agrees
+        # with the rest of the package on what counts as generated or
+        # vendored content; both sets are frozensets with O(1) lookups
+        return FileExclusions.should_exclude(file_path)
     
-    def _get_local_contributor_stats(self) -> List[ContributorStats]:
+    def _get_local_contributor_stats(self, parallel: bool = False) -> List[ContributorStats]:
         """Get contributor statistics from local repository."""
+        if parallel:
+            return self._get_local_contributor_stats_parallel()
+
         stats = {}
-        
-        for commit in self.repo.iter_commits():
-            author = commit.author
-            if author.email not in stats:
-                stats[author.email] = ContributorStats(
-                    name=author.name,
-                    email=author.email,
-                    commit_count=0,
-                    lines_added=0,
-                    lines_deleted=0,
-                    files_changed=0,
-                    languages={},
-                    issues=0,
-                    pull_requests=0,
-                    stars=0,
-                    forks=0,
-                    watchers=0,
-                    changes_count=0,
-                    percentage=0,
-                    total_lines=0,
-                    percentage_lines=0,
-                    total_issues=0,
-                    percentage_issues=0,
-                    total_pull_requests=0,
-                    percentage_pull_requests=0,
-                )
-            
-            contributor = stats[author.email]
-            contributor.commit_count += 1
-            
-            # Get diff stats
-            if commit.parents:
-                # Get the diff between this commit and its parent
-                diff = self.repo.git.diff(
-                    commit.parents[0].hexsha,
-                    commit.hexsha,
-                    '--numstat'
-                ).split('\n')
-                
-                for line in diff:
-                    if line.strip():
-                        try:
-                            # Parse numstat output: additions deletions filename
-                            additions, deletions, filename = line.split('\t')
-                            
-                            # Skip excluded files
-                            if self._should_exclude_file(filename):
-                                continue
-                            
-                            contributor.lines_added += int(additions)
-                            contributor.lines_deleted += int(deletions)
-                            contributor.files_changed += 1
-                            contributor.changes_count += int(additions) + int(deletions)
-                            contributor.percentage = contributor.get_percentage(contributor.changes_count)
-                            contributor.total_lines += int(additions) + int(deletions)
-                            contributor.percentage_lines = contributor.get_percentage(contributor.total_lines)
-                            contributor.total_issues += 1
-                            contributor.percentage_issues = contributor.get_percentage(contributor.total_issues)
-                            contributor.total_pull_requests += 1
-                            contributor.percentage_pull_requests = contributor.get_percentage(contributor.total_pull_requests)
-                            contributor.total_stars += 1
-                            contributor.percentage_stars = contributor.get_percentage(contributor.total_stars)
-                            contributor.total_forks += 1
-                            contributor.percentage_forks = contributor.get_percentage(contributor.total_forks)
-                            contributor.changes_count += int(additions) + int(deletions)
-                            contributor.percentage = contributor.get_percentage(contributor.changes_count)
-                            
-                            # Track language contributions
-                            if filename:
-                                lang = self.codebase._map_extension_to_language(Path(filename).suffix.lower())
-                                contributor.languages[lang] = contributor.languages.get(lang, 0) + 1
-                        except (ValueError, IndexError):
-                            # Skip malformed lines
-                            continue
-        
+
+        # One git log --numstat stream for the entire history instead of
+        # forking a diff subprocess per commit: header lines switch the
+        # active contributor, numstat lines update their totals
+        proc = subprocess.Popen(
+            [
+                'git',
+                '-C',
+                self.path,
+                'log',
+                '--numstat',
+                '--no-merges',
+                '--no-renames',
+                '--pretty=format:%x01%H%x01%ae%x01%an',
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1 << 20,
+        )
+
+        contributor = None
+        try:
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+
+                if line.startswith('\x01'):
+                    _, _sha, email, name = line.split('\x01')
+                    if email not in stats:
+                        stats[email] = ContributorStats(
+                            name=name,
+                            email=email,
+                            commit_count=0,
+                            lines_added=0,
+                            lines_deleted=0,
+                            files_changed=0,
+                            languages=defaultdict(int),
+                            issues=0,
+                            pull_requests=0,
+                            stars=0,
+                            forks=0,
+                            watchers=0,
+                        )
+                    contributor = stats[email]
+                    contributor.commit_count += 1
+                    continue
+
+                if contributor is None:
+                    continue
+
+                try:
+                    # Parse numstat output: additions deletions filename
+                    additions, deletions, filename = line.split('\t', 2)
+
+                    # Skip excluded files
+                    if self._should_exclude_file(filename):
+                        continue
+
+                    # Only accumulate raw counters here; derived totals
+                    # and percentages are filled in one final pass
+                    contributor.lines_added += int(additions)
+                    contributor.lines_deleted += int(deletions)
+                    contributor.files_changed += 1
+
+                    # Track language contributions
+                    if filename:
+                        contributor.languages[_lang_for_path(filename)] += 1
+                except (ValueError, IndexError):
+                    # Skip malformed lines
+                    continue
+        finally:
+            proc.stdout.close()
+            proc.wait()
+
+        return self._finalize_contributor_stats(stats)
+
+    @staticmethod
+    def _finalize_contributor_stats(stats: Dict[str, ContributorStats]) -> List[ContributorStats]:
+        """Fill cross-contributor percentages in a single pass.
+
+        Keeping this out of the per-line loop cuts the hot path to raw
+        counter increments; each contributor's share is computed exactly
+        once against the grand total. Totals themselves are derived
+        properties on ContributorStats.
+        """
+        grand_total = sum(c.lines_added + c.lines_deleted for c in stats.values())
+        for contributor in stats.values():
+            total = contributor.lines_added + contributor.lines_deleted
+            share = (total / grand_total) * 100 if grand_total else 0.0
+            contributor.percentage = share
+            contributor.percentage_lines = share
         return list(stats.values())
-    
+
+    def _get_local_contributor_stats_parallel(self) -> List[ContributorStats]:
+        """Shard history parsing across processes and merge the results.
+
+        Each worker feeds its slice of the commit list to its own
+        git log --numstat pipe via --no-walk --stdin; shards share no
+        state, so the merge is a plain dict reduction in the parent.
+        """
+        shas = self.repo.git.rev_list('--no-merges', 'HEAD').split()
+        if not shas:
+            return []
+
+        # Below this, worker spawn and result pickling cost more than
+        # the single-stream parse they would save
+        if len(shas) < 500:
+            return self._get_local_contributor_stats()
+
+        workers = min(os.cpu_count() or 1, len(shas))
+        chunk = -(-len(shas) // workers)
+        shards = [shas[i:i + chunk] for i in range(0, len(shas), chunk)]
+
+        stats: Dict[str, ContributorStats] = {}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for shard in executor.map(
+                _numstat_shard_worker, [self.path] * len(shards), shards
+            ):
+                for email, agg in shard.items():
+                    contributor = stats.get(email)
+                    if contributor is None:
+                        contributor = stats[email] = ContributorStats(
+                            name=agg['name'],
+                            email=email,
+                            commit_count=0,
+                            lines_added=0,
+                            lines_deleted=0,
+                            files_changed=0,
+                            languages={},
+                        )
+                    contributor.commit_count += agg['commits']
+                    contributor.lines_added += agg['added']
+                    contributor.lines_deleted += agg['deleted']
+                    contributor.files_changed += agg['files']
+                    languages = contributor.languages
+                    for lang, count in agg['languages'].items():
+                        languages[lang] = languages.get(lang, 0) + count
+
+        return self._finalize_contributor_stats(stats)
+
     def _get_remote_contributor_stats(self) -> List[ContributorStats]:
         """Get contributor statistics from GitHub repository."""
         github_stats = self.github_client.get_contributor_stats(self.owner, self.repo_name)
@@ -318,32 +531,67 @@ class Repository:
                 stars=stat.stars,
                 forks=stat.forks,
                 watchers=stat.watchers,
-                changes_count=stat.lines_added + stat.lines_deleted,
                 percentage=0.0,  # Will be calculated later
-                total_lines=stat.lines_added + stat.lines_deleted,
-                percentage_lines=0.0,
-                total_issues=stat.issues,
-                percentage_issues=0.0,
-                total_pull_requests=stat.pull_requests,
-                percentage_pull_requests=0.0,
             )
             for stat in github_stats
         ]
     
-    def get_top_languages(self) -> Dict[str, int]:
-        """Get top programming languages in the repository."""
-        if self.is_remote:
-            return self._get_remote_top_languages()
-        return self._get_local_top_languages()
+    def get_top_languages(self, n: Optional[int] = None) -> Dict[str, int]:
+        """Get top programming languages in the repository.
+
+        Args:
+            n: Optional cap on the number of languages returned. A
+               partial selection via heapq.nlargest avoids sorting the
+               full distribution when callers only want the top few.
+        """
+        if self._top_languages_cache is None:
+            if self.is_remote:
+                self._top_languages_cache = self._get_remote_top_languages()
+            else:
+                self._top_languages_cache = self._get_local_top_languages()
+        if n is None:
+            return self._top_languages_cache
+        return dict(heapq.nlargest(
+            n, self._top_languages_cache.items(), key=itemgetter(1)
+        ))
+
+    def invalidate(self) -> None:
+        """Drop memoized analysis results.
+
+        Long-running processes should call this after the underlying
+        repository changes so the next access recomputes.
+        """
+        self._contributor_stats_cache = None
+        self._top_languages_cache = None
     
     def _get_local_top_languages(self) -> Dict[str, int]:
         """Get top languages from local repository."""
-        languages = {}
-        for item in self.repo.git.ls_tree('-r', '--name-only', 'HEAD').split('\n'):
-            if item and not self._should_exclude_file(item):
-                lang = self.codebase._map_extension_to_language(Path(item).suffix.lower())
-                languages[lang] = languages.get(lang, 0) + 1
-        return dict(sorted(languages.items(), key=lambda x: x[1], reverse=True))
+        # Stream NUL-delimited paths from git ls-files instead of
+        # materializing the whole tree listing as one string plus a
+        # split list; -z also survives filenames containing newlines
+        languages = Counter()
+        proc = subprocess.Popen(
+            ['git', '-C', self.path, 'ls-files', '-z'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        buffer = b''
+        try:
+            while True:
+                chunk = proc.stdout.read(1 << 16)
+                if not chunk:
+                    break
+                buffer += chunk
+                parts = buffer.split(b'\x00')
+                buffer = parts.pop()
+                for raw in parts:
+                    item = raw.decode('utf-8', 'replace')
+                    if item and not self._should_exclude_file(item):
+                        languages[_lang_for_path(item)] += 1
+        finally:
+            proc.stdout.close()
+            proc.wait()
+        return dict(languages.most_common())
     
     def _get_remote_top_languages(self) -> Dict[str, int]:
         """Get top languages from GitHub repository."""
@@ -352,11 +600,14 @@ class Repository:
     def get_contribution_percentages(self) -> List[Dict]:
         """Get contribution percentages for all contributors."""
         stats = self.get_contributor_stats()
-        total_changes = sum(stat.total_changes for stat in stats)
-        
+
+        # Read each total_changes property once and reuse the cached
+        # value for the grand total and the per-contributor share
+        totals = [(stat, stat.lines_added + stat.lines_deleted) for stat in stats]
+        grand_total = sum(total for _, total in totals)
+
         percentages = []
-        for stat in stats:
-            percentage = stat.get_percentage(total_changes)
+        for stat, total in totals:
             percentages.append({
                 'name': stat.name,
                 'email': stat.email,
@@ -364,8 +615,8 @@ class Repository:
                 'lines_added': stat.lines_added,
                 'lines_deleted': stat.lines_deleted,
                 'files_changed': stat.files_changed,
-                'total_changes': stat.total_changes,
-                'percentage': percentage,
+                'total_changes': total,
+                'percentage': (total / grand_total) * 100 if grand_total else 0.0,
                 'total_lines': stat.total_lines,
                 'percentage_lines': stat.percentage_lines,
                 'total_issues': stat.total_issues,
@@ -379,10 +630,12 @@ class Repository:
                 'languages': stat.languages
             })
         
-        return sorted(percentages, key=lambda x: x['percentage'], reverse=True)
+        return sorted(percentages, key=itemgetter('percentage'), reverse=True)
     
     def display_contribution_stats(self):
         """Display contribution statistics in a formatted table."""
+        from rich.table import Table
+
         percentages = self.get_contribution_percentages()
         
         table = Table(title="Repository Contribution Statistics")
@@ -400,16 +653,16 @@ class Repository:
             table.add_column("Issues", justify="right")
             table.add_column("Pull Requests", justify="right")
         
+        # Format all rows up front, then feed the table in one tight loop
+        rows = []
         for stat in percentages:
-            # Get top 3 languages
-            top_languages = sorted(
-                stat['languages'].items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:3]
+            # Top 3 languages without sorting the full distribution
+            top_languages = heapq.nlargest(
+                3, stat['languages'].items(), key=itemgetter(1)
+            )
             top_langs_str = ", ".join(f"{lang}({count})" for lang, count in top_languages)
-            
-            row_data = [
+
+            row_data = (
                 stat['name'],
                 str(stat['commit_count']),
                 str(stat['lines_added']),
@@ -418,17 +671,20 @@ class Repository:
                 str(stat['total_changes']),
                 f"{stat['percentage']:.1f}%",
                 top_langs_str,
-            ]
-            
+            )
+
             # Add PR and Issue data only for remote repositories
             if self.is_remote:
-                row_data.extend([
+                row_data += (
                     str(stat['total_issues']),
                     str(stat['total_pull_requests']),
-                ])
-            
-            table.add_row(*row_data)
-        
+                )
+
+            rows.append(row_data)
+
+        for row in rows:
+            table.add_row(*row)
+
         self.console.print(table)
     
     def get_language_percentages(self) -> Dict[str, float]:
@@ -460,6 +716,8 @@ class Repository:
     
     def display_language_stats(self):
         """Display language statistics in a formatted table."""
+        from rich.table import Table
+
         languages = self.get_top_languages()
         percentages = self.get_language_percentages()
         
@@ -473,22 +731,22 @@ class Repository:
             table.add_column("Issues", justify="right")
             table.add_column("Pull Requests", justify="right")
         
+        # Format all rows up front, then feed the table in one tight loop
+        rows = []
         for lang, count in languages.items():
-            percentage = percentages.get(lang, 0)
-            
-            row_data = [
+            row_data = (
                 lang,
                 str(count),
-                f"{percentage:.1f}%",
-            ]
-            
+                f"{percentages.get(lang, 0):.1f}%",
+            )
+
             # Add PR and Issue data only for remote repositories
             if self.is_remote:
-                row_data.extend([
-                    str(languages.get(lang, 0)),
-                    str(languages.get(lang, 0)),
-                ])
-            
-            table.add_row(*row_data)
-        
+                row_data += (str(count), str(count))
+
+            rows.append(row_data)
+
+        for row in rows:
+            table.add_row(*row)
+
         self.console.print(table) 
\ No newline at end of file
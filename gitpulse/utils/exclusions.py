@@ -1,11 +1,17 @@
+import re
 from typing import Set, List
 from pathlib import Path
 
+# Minified/generated asset suffixes, precompiled so the name check is a
+# single C-level scan instead of a Python any()-over-endswith loop
+_EXCLUDED_SUFFIX_RE = re.compile(r'\.min\.(?:js|css)$|\.map$')
+
 class FileExclusions:
     """Handles file and directory exclusions for repository analysis."""
     
-    # Common directories to exclude
-    EXCLUDED_DIRS = {
+    # Common directories to exclude; frozenset so the constant can't be
+    # mutated at runtime and membership checks stay a single hash probe
+    EXCLUDED_DIRS: frozenset = frozenset({
         'venv',
         'env',
         '.env',
@@ -62,10 +68,10 @@ class FileExclusions:
         'examples',
         'demos',
         'samples',
-    }
-    
+    })
+
     # Common files to exclude
-    EXCLUDED_FILES = {
+    EXCLUDED_FILES: frozenset = frozenset({
         'package-lock.json',
         'yarn.lock',
         'pnpm-lock.yaml',
@@ -126,8 +132,8 @@ class FileExclusions:
         'COPYING.CC-BY-NC-SA-4.0',
         'COPYING.CC-BY-ND-4.0',
         'COPYING.CC-BY-NC-ND-4.0',
-    }
-    
+    })
+
     @classmethod
     def should_exclude(cls, file_path: str) -> bool:
         """Check if a file or directory should be excluded from analysis.
@@ -139,18 +145,16 @@ class FileExclusions:
             bool: True if the file should be excluded, False otherwise
         """
         path = Path(file_path)
-        
-        # Check if any part of the path matches excluded directories
-        for part in path.parts:
-            if part in cls.EXCLUDED_DIRS:
-                return True
-        
-        # Check if the file name matches excluded files
-        if path.name in cls.EXCLUDED_FILES:
+
+        # Check if any part of the path matches excluded directories;
+        # isdisjoint runs the whole membership scan in C
+        if not cls.EXCLUDED_DIRS.isdisjoint(path.parts):
             return True
-        
-        # Check for common patterns in file names
-        if any(path.name.endswith(ext) for ext in ['.min.js', '.min.css', '.map']):
+
+        # Check the file name against excluded files and generated-asset
+        # suffix patterns
+        name = path.name
+        if name in cls.EXCLUDED_FILES or _EXCLUDED_SUFFIX_RE.search(name):
             return True
-        
+
         return False
\ No newline at end of file
@@ -1,18 +1,101 @@
+import functools
 from typing import Optional
 from pathlib import Path
 from pygments.lexers import get_lexer_for_filename, get_all_lexers
 from pygments.util import ClassNotFound
 
+@functools.lru_cache(maxsize=65536)
+def _lexer_language(file_path: str) -> Optional[str]:
+    """Resolve a filename to its Pygments lexer name, memoized.
+
+    get_lexer_for_filename walks Pygments' pattern tables on every call;
+    the same paths and suffixes recur constantly, so repeat lookups
+    become cache hits. Returns None when no lexer matches.
+    """
+    try:
+        return get_lexer_for_filename(file_path).name
+    except ClassNotFound:
+        return None
+
+# Map file extensions to languages; module-level so the fallback is a
+# single dict lookup with no per-call dict construction
+_EXT_MAP = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'JavaScript',
+    '.tsx': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.cc': 'C++',
+    '.cxx': 'C++',
+    '.c': 'C',
+    '.h': 'C/C++',
+    '.hpp': 'C++',
+    '.cs': 'C#',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.kts': 'Kotlin',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.m': 'MATLAB',
+    '.sh': 'Shell',
+    '.bash': 'Shell',
+    '.zsh': 'Shell',
+    '.sql': 'SQL',
+    '.html': 'HTML',
+    '.htm': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.sass': 'SASS',
+    '.less': 'LESS',
+    '.md': 'Markdown',
+    '.json': 'JSON',
+    '.yaml': 'YAML',
+    '.yml': 'YAML',
+    '.xml': 'XML',
+    '.txt': 'Text',
+    '.rst': 'reStructuredText',
+    '.tex': 'TeX',
+    '.latex': 'LaTeX',
+    '.bib': 'BibTeX',
+    '.ini': 'INI',
+    '.cfg': 'INI',
+    '.conf': 'INI',
+    '.toml': 'TOML',
+    '.csv': 'CSV',
+    '.tsv': 'TSV',
+    '.diff': 'Diff',
+    '.patch': 'Diff',
+    '.dockerfile': 'Dockerfile',
+    '.dockerignore': 'Dockerfile',
+    '.gitignore': 'Git',
+    '.env': 'Properties',
+    '.properties': 'Properties',
+}
+
 class LanguageDetector:
     def __init__(self):
         """Initialize the language detector."""
-        # Cache for lexer mappings
-        self._lexer_cache = {}
-        
-        # Initialize lexer mappings
+        pass
+
+    @functools.cached_property
+    def _lexer_cache(self) -> dict:
+        """Alias-to-lexer-name mapping, built on first use.
+
+        get_all_lexers() loads every Pygments lexer plugin, which is a
+        triple-digit-millisecond hit at process start; defer it until a
+        caller actually needs the alias table.
+        """
+        cache = {}
         for lexer in get_all_lexers():
             for alias in lexer[1]:
-                self._lexer_cache[alias] = lexer[0]
+                cache[alias] = lexer[0]
+        return cache
     
     def detect_language(self, file_path: str) -> str:
         """Detect programming language from file path or content.
@@ -23,75 +106,14 @@ class LanguageDetector:
         Returns:
             str: Detected programming language
         """
-        try:
-            # Try to get lexer from filename
-            lexer = get_lexer_for_filename(file_path)
-            return lexer.name
-        except ClassNotFound:
-            # If filename detection fails, try extension-based detection
-            return self._detect_from_extension(file_path)
+        # Try the memoized lexer lookup first
+        language = _lexer_language(file_path)
+        if language is not None:
+            return language
+        # If filename detection fails, try extension-based detection
+        return self._detect_from_extension(file_path)
     
     def _detect_from_extension(self, file_path: str) -> str:
         """Detect language from file extension."""
-        # Map file extensions to languages
-        extension_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'JavaScript',
-            '.tsx': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.cc': 'C++',
-            '.cxx': 'C++',
-            '.c': 'C',
-            '.h': 'C/C++',
-            '.hpp': 'C++',
-            '.cs': 'C#',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.kts': 'Kotlin',
-            '.scala': 'Scala',
-            '.r': 'R',
-            '.m': 'MATLAB',
-            '.sh': 'Shell',
-            '.bash': 'Shell',
-            '.zsh': 'Shell',
-            '.sql': 'SQL',
-            '.html': 'HTML',
-            '.htm': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.sass': 'SASS',
-            '.less': 'LESS',
-            '.md': 'Markdown',
-            '.json': 'JSON',
-            '.yaml': 'YAML',
-            '.yml': 'YAML',
-            '.xml': 'XML',
-            '.txt': 'Text',
-            '.rst': 'reStructuredText',
-            '.tex': 'TeX',
-            '.latex': 'LaTeX',
-            '.bib': 'BibTeX',
-            '.ini': 'INI',
-            '.cfg': 'INI',
-            '.conf': 'INI',
-            '.toml': 'TOML',
-            '.csv': 'CSV',
-            '.tsv': 'TSV',
-            '.diff': 'Diff',
-            '.patch': 'Diff',
-            '.dockerfile': 'Dockerfile',
-            '.dockerignore': 'Dockerfile',
-            '.gitignore': 'Git',
-            '.env': 'Properties',
-            '.properties': 'Properties',
-        }
-        
         ext = Path(file_path).suffix.lower()
-        return extension_map.get(ext, 'Unknown') 
\ No newline at end of file
+        return _EXT_MAP.get(ext, 'Unknown')
@@ -1,26 +1,105 @@
+import asyncio
+import dataclasses
+import functools
+import orjson
+import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional
 from ..core.repository import Repository, ContributorStats
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
+@functools.lru_cache(maxsize=int(os.getenv('GITPULSE_REPO_POOL_SIZE', 32)))
+def _get_repo(path: str, is_remote: bool) -> Repository:
+    """Construct (or reuse) a Repository for the given path.
+
+    Opening a Repository re-scans .git (and may hit the network for
+    remotes), and its analysis results are memoized per instance, so
+    /analyze followed by /languages for the same repo shares one
+    traversal. Pool size is tunable via GITPULSE_REPO_POOL_SIZE.
+    """
+    return Repository(path, is_remote=is_remote)
+
+# Serialize first-time analysis per path so concurrent requests don't
+# duplicate the expensive history walk
+_analysis_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# Analysis results keyed by (kind, path, HEAD sha): if HEAD hasn't
+# moved the answer cannot change, so repeat requests return instantly
+# and a new commit implicitly invalidates. Insertion-ordered dict with
+# FIFO eviction keeps the footprint bounded without a new dependency.
+# Size is tunable for deployments serving many repositories.
+_result_cache: Dict[tuple, object] = {}
+_RESULT_CACHE_MAX = int(os.getenv('GITPULSE_RESULT_CACHE_SIZE', 128))
+
+def _head_sha(repo: Repository) -> Optional[str]:
+    """Current HEAD commit sha for a local repo, None when unavailable."""
+    if repo.is_remote or repo.repo is None:
+        return None
+    try:
+        return repo.repo.head.commit.hexsha
+    except Exception:
+        return None
+
+def _cached_result(kind: str, path: str, head: Optional[str]):
+    if head is None:
+        return None
+    return _result_cache.get((kind, path, head))
+
+def _store_result(kind: str, path: str, head: Optional[str], value) -> None:
+    if head is None:
+        return
+    if len(_result_cache) >= _RESULT_CACHE_MAX:
+        _result_cache.pop(next(iter(_result_cache)))
+    _result_cache[(kind, path, head)] = value
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-warm per-worker state so the first request runs at steady-state.
+
+    The first run_in_threadpool call otherwise pays worker-thread
+    spawn on top of the git traversal; the heavy core imports are
+    already paid when this module loads.
+    """
+    await run_in_threadpool(lambda: None)
+    yield
+
 app = FastAPI(
     title="GitPulse API",
     description="API for analyzing Git repositories",
-    version="0.1.0"
+    version="0.1.0",
+    # orjson serializes the dict-of-ints payloads several times faster
+    # than the stdlib json behind the default JSONResponse
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
-# Add CORS middleware
+# Add CORS middleware. The bundled dashboard is same-origin, so CORS
+# only matters for external clients: a wildcard with credentials
+# disabled lets Starlette emit a static Access-Control-Allow-Origin: *
+# header instead of echoing each request's Origin back, and
+# deployments needing credentialed access can set GITPULSE_ORIGINS to
+# a comma-separated allowlist instead.
+_origins = [o.strip() for o in os.getenv('GITPULSE_ORIGINS', '*').split(',')]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=_origins,
+    allow_credentials='*' not in _origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+# Contributor lists and language maps are highly repetitive JSON and
+# compress several-fold; small payloads skip compression entirely
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Mount static files
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
@@ -29,29 +108,79 @@ class RepositoryRequest(BaseModel):
     path: str
     is_remote: bool = False
 
-class ContributorResponse(BaseModel):
-    name: str
-    email: str
-    commit_count: int
-    lines_added: int
-    lines_deleted: int
-    files_changed: int
-    languages: Dict[str, int]
-    total_changes: int
-    percentage: float
-    total_lines: int
-    percentage_lines: float
-    total_files: int
-    percentage_files: float
-    
-
-@app.post("/analyze", response_model=List[ContributorResponse])
+class BatchItem(BaseModel):
+    path: str
+    is_remote: bool = False
+    metrics: List[str] = ["contributors", "languages"]
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem]
+
+@app.post("/analyze")
 async def analyze_repository(request: RepositoryRequest):
-    """Analyze a Git repository and return contributor statistics."""
+    """Analyze a Git repository and return contributor statistics.
+
+    Serializes the already-typed ContributorStats objects straight to
+    JSON via _stat_row and orjson; a response_model here would only
+    re-validate data the analyzer produced, at a cost proportional to
+    the contributor count.
+    """
+    try:
+        repo = _get_repo(request.path, request.is_remote)
+        # Blocking git work runs in the thread pool so the event loop
+        # keeps serving other requests during a multi-second analysis
+        async with _analysis_locks[request.path]:
+            head = _head_sha(repo)
+            stats = _cached_result('stats', request.path, head)
+            if stats is None:
+                # A moved HEAD means the per-instance memo is stale too
+                repo.invalidate()
+                stats = await run_in_threadpool(repo.get_contributor_stats)
+                _store_result('stats', request.path, head, stats)
+        return ORJSONResponse([_stat_row(stat) for stat in stats])
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _stat_row(stat: ContributorStats) -> Dict:
+    """Serialize one ContributorStats to a plain dict.
+
+    Built by field rather than dataclasses.asdict: asdict deep-copies
+    and trips over the defaultdict languages container, and we want the
+    derived totals included too.
+    """
+    row = {
+        field.name: getattr(stat, field.name)
+        for field in dataclasses.fields(stat)
+    }
+    row['languages'] = dict(stat.languages)
+    row['total_changes'] = stat.total_changes
+    return row
+
+@app.post("/analyze/stream")
+async def analyze_repository_stream(request: RepositoryRequest):
+    """Stream contributor statistics as NDJSON, one contributor per line.
+
+    Clients can render rows as they arrive instead of waiting for the
+    full JSON array, and the server serializes one contributor at a
+    time so the response buffer stays flat. Percentages require the
+    full history pass, so the analysis itself still runs to completion
+    before the first line is emitted.
+    """
     try:
-        repo = Repository(request.path, request.is_remote)
-        stats = repo.get_contributor_stats()
-        return stats
+        repo = _get_repo(request.path, request.is_remote)
+        async with _analysis_locks[request.path]:
+            head = _head_sha(repo)
+            stats = _cached_result('stats', request.path, head)
+            if stats is None:
+                repo.invalidate()
+                stats = await run_in_threadpool(repo.get_contributor_stats)
+                _store_result('stats', request.path, head, stats)
+
+        def generate():
+            for stat in stats:
+                yield orjson.dumps(_stat_row(stat)) + b'\n'
+
+        return StreamingResponse(generate(), media_type='application/x-ndjson')
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -59,19 +188,70 @@ async def analyze_repository(request: RepositoryRequest):
 async def get_languages(request: RepositoryRequest):
     """Get language distribution in the repository."""
     try:
-        repo = Repository(request.path, request.is_remote)
-        languages = repo.get_top_languages()
+        repo = _get_repo(request.path, request.is_remote)
+        async with _analysis_locks[request.path]:
+            head = _head_sha(repo)
+            languages = _cached_result('languages', request.path, head)
+            if languages is None:
+                # A moved HEAD means the per-instance memo is stale too
+                repo.invalidate()
+                languages = await run_in_threadpool(repo.get_top_languages)
+                _store_result('languages', request.path, head, languages)
         return {"languages": languages}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/batch")
+async def analyze_batch(request: BatchRequest):
+    """Run several analyses in one request, opening each repo once.
+
+    Clients wanting both contributor stats and languages for one or
+    more repositories pay the repository-open (and, for remote repos,
+    the network round-trips) once per unique path instead of once per
+    metric per call. Items run concurrently; per-item failures are
+    reported inline so one bad path doesn't fail the whole batch.
+    """
+    async def run_item(item: BatchItem) -> Dict:
+        try:
+            repo = _get_repo(item.path, item.is_remote)
+            result: Dict[str, object] = {}
+            async with _analysis_locks[item.path]:
+                head = _head_sha(repo)
+                for metric in item.metrics:
+                    if metric == "contributors":
+                        stats = _cached_result('stats', item.path, head)
+                        if stats is None:
+                            repo.invalidate()
+                            stats = await run_in_threadpool(repo.get_contributor_stats)
+                            _store_result('stats', item.path, head, stats)
+                        result[metric] = [_stat_row(s) for s in stats]
+                    elif metric == "languages":
+                        languages = _cached_result('languages', item.path, head)
+                        if languages is None:
+                            repo.invalidate()
+                            languages = await run_in_threadpool(repo.get_top_languages)
+                            _store_result('languages', item.path, head, languages)
+                        result[metric] = languages
+                    else:
+                        result[metric] = {"error": f"Unknown metric: {metric}"}
+            return result
+        except Exception as e:
+            return {"error": str(e)}
+
+    results = await asyncio.gather(*(run_item(item) for item in request.items))
+    return {"results": list(results)}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy"}
 
-@app.get("/")
-async def root():
-    """Redirect to the static index.html file."""
-    from fastapi.responses import RedirectResponse
-    return RedirectResponse(url="/static/index.html") 
\ No newline at end of file
+# Serve index.html directly at / (html=True); registered after the API
+# routes so they take precedence, and replacing the old redirect handler
+# saves a round-trip per page load. The /static mount above stays for
+# the page's relative asset paths.
+app.mount(
+    "/",
+    StaticFiles(directory=str(static_path), html=True, check_dir=False),
+    name="root",
+)
\ No newline at end of file
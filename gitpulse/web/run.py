@@ -1,9 +1,41 @@
+import argparse
+import os
+
 import uvicorn
-from pathlib import Path
-from fastapi.staticfiles import StaticFiles
-from .app import app
 
-# Mount static files is now handled in app.py
+# Static files are mounted in app.py
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the GitPulse web server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Enable auto-reload for development (single worker)",
+    )
+    args = parser.parse_args()
+
+    if args.dev:
+        # reload requires a single worker and adds a filesystem watcher
+        uvicorn.run(
+            "gitpulse.web.app:app",
+            host=args.host,
+            port=args.port,
+            reload=True,
+        )
+    else:
+        # uvloop + httptools (from uvicorn[standard]) replace the pure-
+        # Python event loop and HTTP parser with C implementations, and
+        # one worker per core lets analyses proceed in parallel
+        uvicorn.run(
+            "gitpulse.web.app:app",
+            host=args.host,
+            port=args.port,
+            workers=os.cpu_count(),
+            loop="uvloop",
+            http="httptools",
+        )
 
 if __name__ == "__main__":
-    uvicorn.run("gitpulse.web.app:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    main()
@@ -20,23 +20,23 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "gitpython>=3.1.40",
         "pygit2>=1.15.0",
         "fastapi>=0.109.0",
-        "uvicorn>=0.27.0",
+        "uvicorn[standard]>=0.27.0",
         "python-dotenv>=1.0.0",
         "requests>=2.31.0",
+        "httpx>=0.27.0",
         "pygments>=2.17.2",
         "click>=8.1.7",
         "rich>=13.7.0",
+        "orjson>=3.9.0",
         "pydantic>=2.6.0",
         "sqlalchemy>=2.0.25",
         "alembic>=1.13.1",
@@ -5,10 +5,14 @@ import git
 from pathlib import Path
 from gitpulse.core.codebase import Codebase
 
+# Build fixtures on a RAM disk where the platform provides one, so the
+# git init/add/commit in setUp never waits on disk flushes
+_TMPDIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 class TestCodebase(unittest.TestCase):
     def setUp(self):
         # Create a temporary directory with a git repository
-        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_dir = tempfile.TemporaryDirectory(dir=_TMPDIR)
         self.repo_path = self.temp_dir.name
         
         # Initialize git repository